@@ -1,8 +1,7 @@
 import math
 import os
 import threading
-import time
-from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from typing import Optional
 
 from PySide6.QtCore import Qt, QThread, QTimer, Signal
@@ -56,19 +55,20 @@ class CancellableAPICall:
                 raise CancelledError("API call was cancelled")
 
             # Submit the API call to the thread pool
-            self._current_future = self._executor.submit(get_method_ratings, prompt, model)
+            future = self._executor.submit(get_method_ratings, prompt, model)
+            self._current_future = future
 
         try:
-            # Wait for the result, checking for cancellation periodically
-            while not self._current_future.done():
+            # Wait for the result, checking for cancellation every 100ms; wait() returns as soon as it completes
+            while not future.done():
                 with self._lock:
                     if self._cancelled:
-                        self._current_future.cancel()
+                        future.cancel()
                         raise CancelledError("API call was cancelled")
-                time.sleep(0.1)  # Check every 100ms
+                wait((future,), timeout=0.1)
 
             # Get the result
-            result = self._current_future.result()
+            result = future.result()
             with self._lock:
                 if self._cancelled:
                     raise CancelledError("API call was cancelled")
@@ -423,6 +423,9 @@ class AnalysisWorker(QThread):
 
 
 class CodewiseApp(QWidget):
+    # Shared by every section label built via _styled_label
+    _LABEL_STYLE = "font-weight: 600; margin-bottom: 4px;"
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Codewise")
@@ -679,9 +682,10 @@ class CodewiseApp(QWidget):
             self.browse_file_btn.setVisible(False)
             self.browse_file_btn.setEnabled(False)
 
-    def _styled_label(self, text):
+    @staticmethod
+    def _styled_label(text):
         label = QLabel(text)
-        label.setStyleSheet("font-weight: 600; margin-bottom: 4px;")
+        label.setStyleSheet(CodewiseApp._LABEL_STYLE)
         return label
 
     def select_root_directory(self):
@@ -719,7 +723,9 @@ class CodewiseApp(QWidget):
                 timestamp = cached_data.get("timestamp", "unknown")
 
                 # Check for repository changes
-                change_info = self._output_storage.detect_repo_changes(root_directory, file_path, self.analysis_mode)
+                change_info = self._output_storage.detect_repo_changes(
+                    root_directory, file_path, self.analysis_mode, cached_data=cached_data
+                )
 
                 # Build dialog message
                 dialog_title = "Analysis Results Exist"
@@ -1,9 +1,63 @@
 """Parser for structured LLM responses."""
 
 import json
-import re
 from typing import Any, Dict, Optional
 
+# The 16 evaluation criteria, in the order the prompt asks for them
+CRITERIA = (
+    "separation_of_concerns",
+    "documentation",
+    "logic_clarity",
+    "understandability",
+    "efficiency",
+    "error_handling",
+    "testability",
+    "reusability",
+    "code_consistency",
+    "dependency_management",
+    "security_awareness",
+    "side_effects",
+    "scalability",
+    "resource_management",
+    "encapsulation",
+    "readability",
+)
+
+# Display labels for the known criteria, e.g. "separation_of_concerns" -> "Separation Of Concerns"
+CRITERION_LABELS = {criterion: criterion.replace("_", " ").title() for criterion in CRITERIA}
+
+
+def _criterion_label(criterion: str) -> str:
+    # The LLM may return keys outside CRITERIA; those are titled on the fly
+    label = CRITERION_LABELS.get(criterion)
+    return label if label is not None else criterion.replace("_", " ").title()
+
+
+def _extract_fenced_json(response: str) -> Optional[str]:
+    """
+    Return the first JSON object wrapped in a markdown code fence, or None.
+
+    Matches the same text as ``re.search(r"```(?:json)?\\s*(\\{[\\s\\S]*?\\})\\s*```", response)`` but
+    with plain str.find scans, so prose full of braces and backticks can't trigger regex backtracking.
+    """
+    fence = response.find("```")
+    while fence != -1:
+        pos = fence + 3
+        if response.startswith("json", pos):
+            pos += 4
+        while pos < len(response) and response[pos].isspace():
+            pos += 1
+        if response.startswith("{", pos):
+            # Shortest body that ends in "}" and is followed only by whitespace before a closing fence
+            close = response.find("```", pos + 1)
+            while close != -1:
+                body = response[pos:close].rstrip()
+                if body.endswith("}"):
+                    return body
+                close = response.find("```", close + 1)
+        fence = response.find("```", fence + 1)
+    return None
+
 
 def parse_json_response(response: str) -> Dict[str, Any]:
     """
@@ -18,18 +72,20 @@ def parse_json_response(response: str) -> Dict[str, Any]:
         Parsed JSON as dictionary. Returns a default structure if parsing fails.
     """
     # Try to extract JSON from markdown code blocks first
-    json_match = re.search(r"```(?:json)?\s*(\{[\s\S]*?\})\s*```", response)
-    if json_match:
+    fenced = _extract_fenced_json(response)
+    if fenced is not None:
         try:
-            return json.loads(json_match.group(1))
+            return json.loads(fenced)
         except json.JSONDecodeError:
             pass
 
-    # Try to find JSON object in the response (handles cases with extra text)
-    json_match = re.search(r"\{[\s\S]*\}", response)
-    if json_match:
+    # Try to find JSON object in the response (handles cases with extra text):
+    # everything from the first "{" to the last "}"
+    start = response.find("{")
+    end = response.rfind("}")
+    if start != -1 and end > start:
         try:
-            return json.loads(json_match.group(0))
+            return json.loads(response[start : end + 1])
         except json.JSONDecodeError:
             pass
 
@@ -56,42 +112,8 @@ def get_default_response(error: Optional[str] = None) -> Dict[str, Any]:
     return {
         "overall_score": 0,
         "overall_feedback": error or "Unable to parse response",
-        "criteria_scores": {
-            "separation_of_concerns": 0,
-            "documentation": 0,
-            "logic_clarity": 0,
-            "understandability": 0,
-            "efficiency": 0,
-            "error_handling": 0,
-            "testability": 0,
-            "reusability": 0,
-            "code_consistency": 0,
-            "dependency_management": 0,
-            "security_awareness": 0,
-            "side_effects": 0,
-            "scalability": 0,
-            "resource_management": 0,
-            "encapsulation": 0,
-            "readability": 0,
-        },
-        "criteria_feedback": {
-            "separation_of_concerns": None,
-            "documentation": None,
-            "logic_clarity": None,
-            "understandability": None,
-            "efficiency": None,
-            "error_handling": None,
-            "testability": None,
-            "reusability": None,
-            "code_consistency": None,
-            "dependency_management": None,
-            "security_awareness": None,
-            "side_effects": None,
-            "scalability": None,
-            "resource_management": None,
-            "encapsulation": None,
-            "readability": None,
-        },
+        "criteria_scores": dict.fromkeys(CRITERIA, 0),
+        "criteria_feedback": dict.fromkeys(CRITERIA, None),
         "suggestions": [],
         "strengths": [],
     }
@@ -118,8 +140,7 @@ def format_structured_response(response_dict: Dict[str, Any]) -> str:
     output.append("=== Criteria Scores ===")
     criteria_scores = response_dict.get("criteria_scores", {})
     for criterion, score in criteria_scores.items():
-        formatted_criterion = criterion.replace("_", " ").title()
-        output.append(f"{formatted_criterion}: {score}/10")
+        output.append(f"{_criterion_label(criterion)}: {score}/10")
 
     output.append("")
 
@@ -128,8 +149,7 @@ def format_structured_response(response_dict: Dict[str, Any]) -> str:
     criteria_feedback = response_dict.get("criteria_feedback", {})
     for criterion, feedback in criteria_feedback.items():
         if feedback:
-            formatted_criterion = criterion.replace("_", " ").title()
-            output.append(f"{formatted_criterion}: {feedback}")
+            output.append(f"{_criterion_label(criterion)}: {feedback}")
 
     output.append("")
 
@@ -1,18 +1,28 @@
 """Output storage and caching module for Codewise analysis results."""
 
+import contextlib
 import json
 import os
+import tempfile
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, Optional
 
 from source.utils.repo_state import RepositoryState
 
+# Permissions open() gives a new file under the process umask; mkstemp's temporary files start owner-only.
+# The umask can only be read by setting it, so it is read once at import time.
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+_NEW_FILE_MODE = 0o666 & ~_UMASK
+
 
 class AnalysisOutputStorage:
     """Handles saving and loading analysis results in structured JSON format."""
 
     DEFAULT_OUTPUT_DIR = ".codewise_cache"
+    # Per-output sidecar holding what get_all_cached_analyses reports, so listing doesn't parse every result set
+    SUMMARY_SUFFIX = ".meta.json"
 
     def __init__(self, output_dir: Optional[str] = None):
         """
@@ -28,6 +38,61 @@ class AnalysisOutputStorage:
         """Ensure output directory exists."""
         Path(self.output_dir).mkdir(exist_ok=True)
 
+    @staticmethod
+    def _write_json_atomically(path: str, data: Any):
+        """
+        Write data as JSON to a temporary file and rename it into place.
+
+        An interrupted write never leaves a truncated file behind; the temporary file is removed on error.
+        Each call gets its own uniquely named temporary file, so concurrent writers of the same path never
+        share or truncate each other's temporary file - the last rename wins with a complete file.
+        """
+        fd, tmp_path = tempfile.mkstemp(
+            dir=os.path.dirname(path) or ".", prefix=f"{os.path.basename(path)}.", suffix=".tmp"
+        )
+        try:
+            with open(fd, "w") as f:
+                os.fchmod(f.fileno(), _NEW_FILE_MODE)
+                json.dump(data, f, indent=2)
+            os.replace(tmp_path, path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.remove(tmp_path)
+            raise
+
+    @classmethod
+    def _get_summary_path(cls, output_path: str) -> str:
+        """Get the path of the summary sidecar stored next to an analysis output file."""
+        return os.path.splitext(output_path)[0] + cls.SUMMARY_SUFFIX
+
+    @staticmethod
+    def _summarize(data: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the summary of an analysis output reported by get_all_cached_analyses."""
+        return {
+            "timestamp": data.get("timestamp"),
+            "analysis_mode": data.get("analysis_mode"),
+            "root_directory": data.get("root_directory"),
+            "file_path": data.get("file_path"),
+            "result_count": len(data.get("results", [])),
+        }
+
+    def _load_summary(self, output_path: str) -> Optional[Dict[str, Any]]:
+        """
+        Load the summary sidecar of an analysis output file.
+
+        Returns:
+            The summary, or None if it is missing, unreadable or older than the output file
+        """
+        summary_path = self._get_summary_path(output_path)
+        try:
+            if os.stat(summary_path).st_mtime_ns < os.stat(output_path).st_mtime_ns:
+                return None
+            with open(summary_path, "r") as f:
+                summary = json.load(f)
+        except (json.JSONDecodeError, IOError):
+            return None
+        return summary if isinstance(summary, dict) else None
+
     def get_analysis_filename(self, root_directory: str, file_path: Optional[str], analysis_mode: str) -> str:
         """
         Generate a unique filename for the analysis output.
@@ -121,7 +186,7 @@ class AnalysisOutputStorage:
         output_path = self.get_analysis_output_path(root_directory, file_path, analysis_mode)
 
         # Compute repository state at time of analysis
-        repo_state = RepositoryState.compute_repo_state(root_directory)
+        repo_state, repo_fingerprints = RepositoryState.compute_repo_state_with_fingerprints(root_directory)
         repo_hash = RepositoryState.compute_repo_hash(repo_state)
 
         # Build complete output structure
@@ -133,6 +198,7 @@ class AnalysisOutputStorage:
             "metadata": metadata or {},
             "repo_hash": repo_hash,  # Hash of repository state at time of analysis
             "repo_state": repo_state,  # Detailed file hashes for change detection
+            "repo_fingerprints": repo_fingerprints,  # [size, mtime_ns] per file so unchanged files skip rehashing
             "results": analysis_results,
         }
 
@@ -141,12 +207,20 @@ class AnalysisOutputStorage:
 
         # Write to file
         try:
-            with open(output_path, "w") as f:
-                json.dump(output_data, f, indent=2)
+            self._write_json_atomically(output_path, output_data)
         except IOError as e:
             print(f"Error saving analysis output to {output_path}: {e}")
             raise
 
+        # Write the summary sidecar; on failure remove any stale one so listings fall back to the output file
+        summary_path = self._get_summary_path(output_path)
+        try:
+            self._write_json_atomically(summary_path, self._summarize(output_data))
+        except IOError as e:
+            print(f"Error saving analysis summary to {summary_path}: {e}")
+            with contextlib.suppress(OSError):
+                os.remove(summary_path)
+
         return output_path
 
     def delete_analysis_output(self, root_directory: str, file_path: Optional[str], analysis_mode: str) -> bool:
@@ -168,11 +242,14 @@ class AnalysisOutputStorage:
 
         try:
             os.remove(output_path)
-            return True
         except OSError as e:
             print(f"Error deleting analysis output {output_path}: {e}")
             return False
 
+        with contextlib.suppress(OSError):
+            os.remove(self._get_summary_path(output_path))
+        return True
+
     def get_all_cached_analyses(self) -> Dict[str, Dict[str, Any]]:
         """
         Get information about all cached analyses.
@@ -186,25 +263,26 @@ class AnalysisOutputStorage:
             return cached
 
         for filename in os.listdir(self.output_dir):
-            if filename.endswith(".json"):
+            if filename.endswith(".json") and not filename.endswith(self.SUMMARY_SUFFIX):
                 file_path = os.path.join(self.output_dir, filename)
-                try:
-                    with open(file_path, "r") as f:
-                        data = json.load(f)
-                        cached[filename] = {
-                            "timestamp": data.get("timestamp"),
-                            "analysis_mode": data.get("analysis_mode"),
-                            "root_directory": data.get("root_directory"),
-                            "file_path": data.get("file_path"),
-                            "result_count": len(data.get("results", [])),
-                        }
-                except (json.JSONDecodeError, IOError):
-                    pass
+                summary = self._load_summary(file_path)
+                if summary is None:
+                    # No usable sidecar (e.g. saved by an older version): summarize the output file itself
+                    try:
+                        with open(file_path, "r") as f:
+                            summary = self._summarize(json.load(f))
+                    except (json.JSONDecodeError, IOError):
+                        continue
+                cached[filename] = summary
 
         return cached
 
     def detect_repo_changes(
-        self, root_directory: str, file_path: Optional[str], analysis_mode: str
+        self,
+        root_directory: str,
+        file_path: Optional[str],
+        analysis_mode: str,
+        cached_data: Optional[Dict[str, Any]] = None,
     ) -> Optional[Dict[str, Any]]:
         """
         Detect if repository has changed since cached analysis was created.
@@ -213,12 +291,14 @@ class AnalysisOutputStorage:
             root_directory: Root directory being analyzed
             file_path: File path for single file mode (None for project mode)
             analysis_mode: Either "single_file" or "entire_project"
+            cached_data: Analysis output the caller already loaded; read from disk when omitted
 
         Returns:
             Dictionary with change information if changes detected, None if no cached data or no changes
         """
         # Load cached data
-        cached_data = self.load_analysis_output(root_directory, file_path, analysis_mode)
+        if cached_data is None:
+            cached_data = self.load_analysis_output(root_directory, file_path, analysis_mode)
         if not cached_data:
             return None
 
@@ -228,18 +308,18 @@ class AnalysisOutputStorage:
             # Old format without repo state, assume no changes can be detected
             return None
 
-        # Compute current repository state
-        current_repo_state = RepositoryState.compute_repo_state(root_directory)
+        # Compute current repository state, only rehashing files whose size or mtime changed
+        current_repo_state, _ = RepositoryState.compute_repo_state_with_fingerprints(
+            root_directory, cached_repo_state, cached_data.get("repo_fingerprints")
+        )
 
-        # Detect changes
-        changes = RepositoryState.detect_changes(cached_repo_state, current_repo_state)
-
-        # If there are any changes, return the change information
-        if changes['added'] or changes['removed'] or changes['modified']:
-            return {
-                'has_changes': True,
-                'changes': changes,
-                'cached_timestamp': cached_data.get('timestamp'),
-            }
+        # Unchanged repository: one C-level dict comparison instead of building the change lists
+        if current_repo_state == cached_repo_state:
+            return None
 
-        return None
+        # The states differ, so at least one file was added, removed or modified
+        return {
+            'has_changes': True,
+            'changes': RepositoryState.detect_changes(cached_repo_state, current_repo_state),
+            'cached_timestamp': cached_data.get('timestamp'),
+        }
@@ -2,8 +2,20 @@
 
 import hashlib
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# A file modified this recently could be rewritten again within the filesystem's timestamp granularity
+# without its size or mtime changing, so its fingerprint is not recorded and it is always rehashed
+_RACY_WINDOW_NS = 2_000_000_000
+
+# Common directories that shouldn't affect analysis; pruned from the walk without being descended into
+_EXCLUDED_DIRS = frozenset({'.git', '__pycache__', '.venv', 'venv', 'node_modules', '.codewise_cache'})
+
+# Below this many files to hash, starting a thread pool costs more than it saves
+_PARALLEL_HASH_THRESHOLD = 8
 
 
 class RepositoryState:
@@ -24,17 +36,87 @@ class RepositoryState:
         Returns:
             Hex digest of the file's SHA256 hash
         """
-        sha256_hash = hashlib.sha256()
         try:
             with open(file_path, "rb") as f:
-                # Read file in chunks to handle large files efficiently
-                for byte_block in iter(lambda: f.read(4096), b""):
-                    sha256_hash.update(byte_block)
-            return sha256_hash.hexdigest()
+                # file_digest reads straight into a reusable buffer (or hashes the fd directly) without
+                # allocating a bytes object per chunk
+                return hashlib.file_digest(f, "sha256").hexdigest()
         except (IOError, OSError):
             # Return empty hash for unreadable files
             return ""
 
+    @staticmethod
+    def _compute_file_hashes(file_paths: List[str]) -> Dict[str, str]:
+        """
+        Hash several files, overlapping their reads on a thread pool when there are enough of them.
+
+        hashlib releases the GIL while digesting, so the worker threads run in parallel.
+
+        Args:
+            file_paths: Paths of the files to hash
+
+        Returns:
+            Dictionary mapping each path to its hash ("" for unreadable files)
+        """
+        if len(file_paths) < _PARALLEL_HASH_THRESHOLD:
+            return {file_path: RepositoryState._compute_file_hash(file_path) for file_path in file_paths}
+
+        max_workers = min(32, (os.cpu_count() or 1) * 4, len(file_paths))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return dict(zip(file_paths, executor.map(RepositoryState._compute_file_hash, file_paths)))
+
+    @staticmethod
+    def _file_fingerprint(entry: os.DirEntry) -> Optional[List[int]]:
+        """
+        Get a cheap fingerprint of a file from its metadata.
+
+        Args:
+            entry: Directory entry of the file, as yielded by os.scandir
+
+        Returns:
+            [size, mtime_ns] of the file, or None if it can't be stat'ed
+        """
+        try:
+            # DirEntry caches its stat result, so this is at most one syscall per file
+            stat = entry.stat()
+        except OSError:
+            return None
+        return [stat.st_size, stat.st_mtime_ns]
+
+    @staticmethod
+    def _iter_python_files(root_directory: str) -> Iterator[os.DirEntry]:
+        """
+        Yield the directory entries of all non-test Python files under root_directory.
+
+        Walks with os.scandir and an explicit stack, pruning excluded directories, and like os.walk does not
+        descend into symlinked directories or fail on unreadable ones.
+
+        Args:
+            root_directory: Root directory of the repository
+
+        Yields:
+            os.DirEntry for each matching file
+        """
+        pending = [root_directory]
+        while pending:
+            try:
+                with os.scandir(pending.pop()) as it:
+                    entries = list(it)
+            except OSError:
+                continue
+
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+
+                if is_dir:
+                    if entry.name not in _EXCLUDED_DIRS and not entry.is_symlink():
+                        pending.append(entry.path)
+                elif entry.name.endswith('.py') and not entry.name.startswith('test_'):
+                    yield entry
+
     @staticmethod
     def compute_repo_state(root_directory: str) -> Dict[str, str]:
         """
@@ -46,22 +128,55 @@ class RepositoryState:
         Returns:
             Dictionary mapping file paths to their SHA256 hashes
         """
-        file_hashes = {}
+        file_hashes, _ = RepositoryState.compute_repo_state_with_fingerprints(root_directory)
+        return file_hashes
 
-        for root, dirs, files in os.walk(root_directory):
-            # Skip common directories that shouldn't affect analysis
-            dirs[:] = [
-                d for d in dirs if d not in ['.git', '__pycache__', '.venv', 'venv', 'node_modules', '.codewise_cache']
-            ]
+    @staticmethod
+    def compute_repo_state_with_fingerprints(
+        root_directory: str,
+        previous_state: Optional[Dict[str, str]] = None,
+        previous_fingerprints: Optional[Dict[str, List[int]]] = None,
+    ) -> Tuple[Dict[str, str], Dict[str, List[int]]]:
+        """
+        Compute hash state of all Python files, reusing previous hashes for files whose fingerprint is unchanged.
 
-            for file in files:
-                if file.endswith('.py') and not file.startswith('test_'):
-                    file_path = os.path.join(root, file)
-                    file_hash = RepositoryState._compute_file_hash(file_path)
-                    if file_hash:  # Only include successfully hashed files
-                        file_hashes[file_path] = file_hash
+        A file is only rehashed when it has no previous hash, no previous fingerprint, or its current
+        [size, mtime_ns] differs from the previous one.
 
-        return file_hashes
+        Args:
+            root_directory: Root directory of the repository
+            previous_state: Previously computed file path -> hash mapping
+            previous_fingerprints: Fingerprints recorded alongside previous_state
+
+        Returns:
+            Tuple of (file path -> SHA256 hash, file path -> [size, mtime_ns]). Recently modified files
+            are left out of the fingerprints so they are rehashed next time.
+        """
+        previous_state = previous_state or {}
+        previous_fingerprints = previous_fingerprints or {}
+        racy_after_ns = time.time_ns() - _RACY_WINDOW_NS
+        # (file path, fingerprint, reusable hash or "") in walk order
+        entries = []
+
+        for entry in RepositoryState._iter_python_files(root_directory):
+            fingerprint = RepositoryState._file_fingerprint(entry)
+            file_hash = ""
+            if fingerprint is not None and fingerprint == previous_fingerprints.get(entry.path):
+                file_hash = previous_state.get(entry.path, "")
+            entries.append((entry.path, fingerprint, file_hash))
+
+        new_hashes = RepositoryState._compute_file_hashes([path for path, _, file_hash in entries if not file_hash])
+
+        file_hashes = {}
+        fingerprints = {}
+        for file_path, fingerprint, file_hash in entries:
+            file_hash = file_hash or new_hashes[file_path]
+            if file_hash:  # Only include successfully hashed files
+                file_hashes[file_path] = file_hash
+                if fingerprint is not None and fingerprint[1] < racy_after_ns:
+                    fingerprints[file_path] = fingerprint
+
+        return file_hashes, fingerprints
 
     @staticmethod
     def compute_repo_hash(file_hashes: Dict[str, str]) -> str:
@@ -74,16 +189,13 @@ class RepositoryState:
         Returns:
             Single hash representing the repository state
         """
-        sha256_hash = hashlib.sha256()
-
-        # Sort for consistent ordering
-        for file_path in sorted(file_hashes.keys()):
-            file_hash = file_hashes[file_path]
-            # Combine file path and hash to ensure changes in file location or content are detected
-            combined = f"{file_path}:{file_hash}".encode('utf-8')
-            sha256_hash.update(combined)
-
-        return sha256_hash.hexdigest()
+        # Sort for consistent ordering. Each entry combines file path and hash so changes in file location or
+        # content are detected; NUL/newline framing keeps distinct states from concatenating to the same bytes.
+        # Entries are fed to the hasher one at a time, so memory stays flat however large the repository is.
+        hasher = hashlib.sha256()
+        for file_path, file_hash in sorted(file_hashes.items()):
+            hasher.update(f"{file_path}\0{file_hash}\n".encode('utf-8'))
+        return hasher.hexdigest()
 
     @staticmethod
     def detect_changes(old_state: Dict[str, str], new_state: Dict[str, str]) -> Dict[str, list]:
@@ -97,28 +209,21 @@ class RepositoryState:
         Returns:
             Dictionary with 'added', 'removed', and 'modified' file lists
         """
-        changes = {
-            'added': [],
-            'removed': [],
-            'modified': [],
+        # Set operations run directly on the keys views; lists are sorted so the reported order is stable
+        old_files = old_state.keys()
+        new_files = new_state.keys()
+
+        return {
+            # Files that were added
+            'added': sorted(new_files - old_files),
+            # Files that were removed
+            'removed': sorted(old_files - new_files),
+            # Files that were modified (existed in both but hash changed)
+            'modified': sorted(
+                file_path for file_path in old_files & new_files if old_state[file_path] != new_state[file_path]
+            ),
         }
 
-        old_files = set(old_state.keys())
-        new_files = set(new_state.keys())
-
-        # Files that were added
-        changes['added'] = list(new_files - old_files)
-
-        # Files that were removed
-        changes['removed'] = list(old_files - new_files)
-
-        # Files that were modified (existed in both but hash changed)
-        for file_path in old_files & new_files:
-            if old_state[file_path] != new_state[file_path]:
-                changes['modified'].append(file_path)
-
-        return changes
-
     @staticmethod
     def has_changes(old_state: Dict[str, str], new_state: Dict[str, str]) -> bool:
         """
@@ -131,5 +236,5 @@ class RepositoryState:
         Returns:
             True if any changes detected, False otherwise
         """
-        changes = RepositoryState.detect_changes(old_state, new_state)
-        return bool(changes['added'] or changes['removed'] or changes['modified'])
+        # Any added, removed or modified file makes the mappings unequal; the comparison stops at the first difference
+        return old_state != new_state
@@ -0,0 +1,67 @@
+import os
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+# Headless by default: skips windowing-system plugin loading and any display handshake.
+# Must be set before the QApplication is created; an explicit QT_QPA_PLATFORM from the environment still wins.
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+# Drop Qt's debug-category logging; tests never read it
+os.environ.setdefault("QT_LOGGING_RULES", "*.debug=false")
+
+import pytest
+from PySide6.QtCore import QEvent
+from PySide6.QtWidgets import QApplication, QMessageBox
+
+from source.utils.output_storage import AnalysisOutputStorage
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """Single QApplication shared by every GUI test in the session.
+
+    Teardown flushes widgets scheduled with deleteLater() while the application still exists, so Qt objects
+    aren't left for interpreter shutdown to destroy.
+    """
+    app = QApplication.instance() or QApplication([])
+    yield app
+    QApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+
+
+def _no_dialog(*args, **kwargs):
+    return None
+
+
+@pytest.fixture(scope="session", autouse=True)
+def suppress_message_boxes():
+    """Turn QMessageBox popups into no-ops for the whole session so no dialog can block a test"""
+    # Patch at the source - where it's actually used
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(QMessageBox, 'information', _no_dialog)
+        mp.setattr(QMessageBox, 'warning', _no_dialog)
+        mp.setattr(QMessageBox, 'critical', _no_dialog)
+        yield
+
+
+@pytest.fixture(scope="session", autouse=True)
+def isolated_output_dir(tmp_path_factory):
+    """Point the default analysis cache at a per-session temp dir so no test writes .codewise_cache into the CWD.
+
+    Session-scoped so it is in place before class-scoped CodewiseApp fixtures build their storage; under
+    pytest-xdist every worker gets its own session and therefore its own directory.
+    """
+    output_dir = tmp_path_factory.mktemp("codewise_cache")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(AnalysisOutputStorage, "DEFAULT_OUTPUT_DIR", str(output_dir))
+        yield output_dir
+
+
+@pytest.fixture
+def message_box_mocks(monkeypatch):
+    """Opt-in recording mocks for tests that assert which QMessageBox dialog was shown"""
+    mocks = SimpleNamespace(
+        info=Mock(return_value=None), warning=Mock(return_value=None), critical=Mock(return_value=None)
+    )
+    monkeypatch.setattr(QMessageBox, 'information', mocks.info)
+    monkeypatch.setattr(QMessageBox, 'warning', mocks.warning)
+    monkeypatch.setattr(QMessageBox, 'critical', mocks.critical)
+    return mocks
@@ -10,12 +10,117 @@ Tests focus on:
 6. Processing multiple methods (critical fix verification)
 """
 
-from unittest.mock import Mock, patch
+from unittest.mock import DEFAULT, Mock, patch
 
-from source.codewise_gui.codewise_ui_utils import AnalysisWorker
+import pytest
+from PySide6.QtCore import QThread
 
-# Import the shared fixtures and helper from test_ui_utils
-from .test_ui_utils import get_qapp, suppress_message_boxes  # noqa: F401
+from source.codewise_gui import codewise_ui_utils
+from source.codewise_gui.codewise_ui_utils import AnalysisWorker, CancellableAPICall
+from source.logic.code_ast_parser import CallSiteInfo, MethodIdentifier, MethodPointer
+from source.utils.output_storage import AnalysisOutputStorage
+
+# Opaque stand-in for the AST nodes the worker only passes through to the (patched) get_method_body
+_FN_NODE = object()
+
+
+def _spy(worker, *signal_names):
+    """Record every payload emitted on each named worker signal, as a list of argument tuples keyed by signal name"""
+    emitted = {name: [] for name in signal_names}
+    for name in signal_names:
+        getattr(worker, name).connect(lambda *args, _calls=emitted[name]: _calls.append(args))
+    return emitted
+
+
+class _Signal:
+    """Plain-Python stand-in for a Qt signal: connect() registers slots, emit() calls them in order"""
+
+    def __init__(self):
+        self._slots = []
+
+    def connect(self, slot):
+        self._slots.append(slot)
+
+    def emit(self, *args):
+        for slot in self._slots:
+            slot(*args)
+
+
+class _SyncWorker:
+    """AnalysisWorker's analysis logic without the QThread base, driven synchronously through run().
+
+    Used by tests that exercise _process_methods/_process_entire_project only, so no QObject is allocated.
+    Keep the attributes set in __init__ in step with AnalysisWorker.__init__.
+    """
+
+    run = AnalysisWorker.run
+    cancel = AnalysisWorker.cancel
+    _process_methods = AnalysisWorker._process_methods
+    _process_entire_project = AnalysisWorker._process_entire_project
+
+    def __init__(self, root_directory, file_path=None, analysis_mode="single_file"):
+        self.root_directory = root_directory
+        self.file_path = file_path
+        self.analysis_mode = analysis_mode
+        self._is_cancelled = False
+        self._api_call = CancellableAPICall()
+        self._output_storage = AnalysisOutputStorage()
+        self.progress = _Signal()
+        self.api_response = _Signal()
+        self.finished = _Signal()
+        self.error = _Signal()
+
+    def quit(self):
+        pass
+
+    def wait(self):
+        pass
+
+
+@pytest.fixture(scope="session")
+def fake_walk_tree():
+    """A two-directory project layout in os.walk's (root, dirs, files) shape"""
+    return (
+        ("/test/root", ("src",), ("test.py",)),
+        ("/test/root/src", (), ("main.py",)),
+    )
+
+
+@pytest.fixture(scope="class")
+def method_pointer_factory():
+    """Build real MethodPointer tuples; only the per-test patches need to be fresh.
+
+    Plain NamedTuples are hashable, so they work as collect_method_usages keys without any Mock machinery.
+    The function node is the opaque _FN_NODE placeholder because get_method_body is always patched.
+    """
+
+    def _make(name, path="/test/file.py"):
+        return MethodPointer(MethodIdentifier("file", name), _FN_NODE, path)
+
+    return _make
+
+
+@pytest.fixture(scope="class")
+def call_site():
+    """A single call site shared by every method in a class's tests; the worker only reads it"""
+    return CallSiteInfo(call_node=None, function_node=_FN_NODE, file_path="/test/file.py")
+
+
+@pytest.fixture
+def worker_mocks():
+    """Patch the analysis collaborators the worker calls, with get_method_body returning a stub body.
+
+    Yields patch.multiple's name -> mock dict; tests set return values or side effects on the entries they need.
+    """
+    with patch.multiple(
+        codewise_ui_utils,
+        collect_method_usages=DEFAULT,
+        collect_method_usages_entire_project=DEFAULT,
+        get_method_ratings=DEFAULT,
+        get_method_body=DEFAULT,
+    ) as mocks:
+        mocks["get_method_body"].return_value = "def test_method(): pass"
+        yield mocks
 
 
 class TestAnalysisWorkerInitialization:
@@ -47,46 +152,33 @@ class TestAnalysisWorkerInitialization:
 
         assert worker._is_cancelled
 
+    def test_sync_worker_mirrors_worker_state(self):
+        """The synchronous test double must carry every attribute AnalysisWorker sets up"""
+        real = AnalysisWorker("/test/root", "/test/file.py")
+        double = _SyncWorker("/test/root", "/test/file.py")
+
+        worker_state = {name for name in vars(real) if not hasattr(QThread, name)}
+        assert worker_state <= set(vars(double))
+
 
 class TestAnalysisWorkerSingleFileMode:
     """Test AnalysisWorker single file analysis"""
 
-    @patch("source.codewise_gui.codewise_ui_utils.collect_method_usages")
-    @patch("source.codewise_gui.codewise_ui_utils.get_method_ratings")
-    def test_successful_single_file_analysis(self, mock_get_ratings, mock_collect_usages):
+    def test_successful_single_file_analysis(self, worker_mocks, method_pointer_factory, call_site):
         """Test successful single file analysis workflow"""
         # Setup mocks
-        mock_method_pointer = Mock()
-        mock_method_pointer.method_id.method_name = "test_method"
-        mock_method_pointer.file_path = "/test/file.py"
-        mock_call_site_info = Mock()
-        mock_call_site_info.function_node = Mock()
-        mock_call_site_info.file_path = "/test/file.py"
-
-        mock_collect_usages.return_value = {mock_method_pointer: [mock_call_site_info]}
-        mock_get_ratings.return_value = "Test API response"
-
-        with patch("source.codewise_gui.codewise_ui_utils.get_method_body") as mock_get_body:
-            mock_get_body.return_value = "def test_method(): pass"
+        mock_method_pointer = method_pointer_factory("test_method")
+        worker_mocks["collect_method_usages"].return_value = {mock_method_pointer: [call_site]}
+        worker_mocks["get_method_ratings"].return_value = "Test API response"
 
-            worker = AnalysisWorker("/test/root", "/test/file.py")
-
-            # Mock signals
-            progress_signal = Mock()
-            api_response_signal = Mock()
-            finished_signal = Mock()
-
-            worker.progress.connect(progress_signal)
-            worker.api_response.connect(api_response_signal)
-            worker.finished.connect(finished_signal)
+        worker = AnalysisWorker("/test/root", "/test/file.py")
+        fired = _spy(worker, "progress", "api_response", "finished")
 
-            # Run the worker
-            worker.run()
+        # Run the worker
+        worker.run()
 
-            # Verify signals were emitted
-            assert progress_signal.called
-            assert api_response_signal.called
-            assert finished_signal.called
+        # Verify signals were emitted
+        assert all(fired.values())
 
     @patch("source.codewise_gui.codewise_ui_utils.collect_method_usages")
     def test_single_file_no_methods_found(self, mock_collect_usages):
@@ -94,15 +186,12 @@ class TestAnalysisWorkerSingleFileMode:
         mock_collect_usages.return_value = {}
 
         worker = AnalysisWorker("/test/root", "/test/file.py")
-
-        error_signal = Mock()
-        worker.error.connect(error_signal)
+        fired = _spy(worker, "error")
 
         worker.run()
 
-        assert error_signal.called
-        call_args = error_signal.call_args[0][0]
-        assert "No methods found in the specified file" in call_args
+        assert fired["error"]
+        assert "No methods found in the specified file" in fired["error"][-1][0]
 
     @patch("source.codewise_gui.codewise_ui_utils.collect_method_usages")
     def test_single_file_exception_handling(self, mock_collect_usages):
@@ -110,55 +199,32 @@ class TestAnalysisWorkerSingleFileMode:
         mock_collect_usages.side_effect = Exception("Test error")
 
         worker = AnalysisWorker("/test/root", "/test/file.py")
-
-        error_signal = Mock()
-        worker.error.connect(error_signal)
+        fired = _spy(worker, "error")
 
         worker.run()
 
-        assert error_signal.called
-        call_args = error_signal.call_args[0][0]
-        assert "Error during analysis" in call_args
+        assert fired["error"]
+        assert "Error during analysis" in fired["error"][-1][0]
 
 
 class TestAnalysisWorkerEntireProjectMode:
     """Test AnalysisWorker entire project analysis"""
 
-    @patch("source.codewise_gui.codewise_ui_utils.collect_method_usages_entire_project")
-    @patch("source.codewise_gui.codewise_ui_utils.get_method_ratings")
-    def test_successful_entire_project_analysis(self, mock_get_ratings, mock_collect_entire_project):
+    def test_successful_entire_project_analysis(self, worker_mocks, method_pointer_factory, call_site):
         """Test successful entire project analysis workflow"""
         # Setup mocks
-        mock_method_pointer = Mock()
-        mock_method_pointer.method_id.method_name = "test_method"
-        mock_method_pointer.file_path = "/test/file.py"
-        mock_call_site_info = Mock()
-        mock_call_site_info.function_node = Mock()
-        mock_call_site_info.file_path = "/test/file.py"
-
-        mock_collect_entire_project.return_value = {
-            "test_file.py:test_method": (mock_method_pointer, [mock_call_site_info])
+        mock_method_pointer = method_pointer_factory("test_method")
+        worker_mocks["collect_method_usages_entire_project"].return_value = {
+            "test_file.py:test_method": (mock_method_pointer, [call_site])
         }
-        mock_get_ratings.return_value = "Test API response"
-
-        with patch("source.codewise_gui.codewise_ui_utils.get_method_body") as mock_get_body:
-            mock_get_body.return_value = "def test_method(): pass"
+        worker_mocks["get_method_ratings"].return_value = "Test API response"
 
-            worker = AnalysisWorker("/test/root", analysis_mode="entire_project")
-
-            progress_signal = Mock()
-            api_response_signal = Mock()
-            finished_signal = Mock()
-
-            worker.progress.connect(progress_signal)
-            worker.api_response.connect(api_response_signal)
-            worker.finished.connect(finished_signal)
+        worker = AnalysisWorker("/test/root", analysis_mode="entire_project")
+        fired = _spy(worker, "progress", "api_response", "finished")
 
-            worker.run()
+        worker.run()
 
-            assert progress_signal.called
-            assert api_response_signal.called
-            assert finished_signal.called
+        assert all(fired.values())
 
     @patch("source.codewise_gui.codewise_ui_utils.collect_method_usages_entire_project")
     def test_entire_project_no_methods_found(self, mock_collect_entire_project):
@@ -167,32 +233,27 @@ class TestAnalysisWorkerEntireProjectMode:
 
         worker = AnalysisWorker("/test/root", analysis_mode="entire_project")
 
-        error_signal = Mock()
-        worker.error.connect(error_signal)
+        fired = _spy(worker, "error")
 
         worker.run()
 
-        assert error_signal.called
-        call_args = error_signal.call_args[0][0]
-        assert "No methods found in the project" in call_args
+        assert fired["error"]
+        assert "No methods found in the project" in fired["error"][-1][0]
 
     @patch("source.codewise_gui.codewise_ui_utils.collect_method_usages")
-    def test_collect_method_usages_entire_project_helper(self, mock_collect):
+    def test_collect_method_usages_entire_project_helper(
+        self, mock_collect, method_pointer_factory, call_site, fake_walk_tree
+    ):
         """Test the collect_method_usages_entire_project function"""
         from source.codewise_gui.codewise_ui_utils import collect_method_usages_entire_project
 
-        mock_method_pointer = Mock()
-        mock_method_pointer.file_path = "/test/file.py"
-        mock_method_pointer.method_id.method_name = "test_method"
-        mock_call_site_info = Mock()
+        mock_method_pointer = method_pointer_factory("test_method")
 
-        mock_collect.return_value = {mock_method_pointer: [mock_call_site_info]}
+        mock_collect.return_value = {mock_method_pointer: [call_site]}
 
         with patch("os.walk") as mock_walk:
-            mock_walk.return_value = [
-                ("/test/root", ["src"], ["test.py"]),
-                ("/test/root/src", [], ["main.py"]),
-            ]
+            # Fresh dirs lists per walk: collect_method_usages_entire_project prunes them in place
+            mock_walk.return_value = [(root, list(dirs), files) for root, dirs, files in fake_walk_tree]
 
             result = collect_method_usages_entire_project("/test/root")
 
@@ -203,301 +264,206 @@ class TestAnalysisWorkerEntireProjectMode:
 class TestAnalysisWorkerMultipleMethods:
     """Test processing of multiple methods (critical fix verification)"""
 
-    @patch("source.codewise_gui.codewise_ui_utils.collect_method_usages")
-    @patch("source.codewise_gui.codewise_ui_utils.get_method_ratings")
-    def test_processes_all_methods_in_file(self, mock_get_ratings, mock_collect_usages):
+    def test_processes_all_methods_in_file(self, worker_mocks, method_pointer_factory, call_site):
         """Test that ALL methods in a file are processed, not just the first one"""
         # Create 3 methods to verify all are processed
-        mock_method_pointer1 = Mock()
-        mock_method_pointer1.method_id.method_name = "test_method_1"
-        mock_method_pointer1.file_path = "/test/file.py"
-
-        mock_method_pointer2 = Mock()
-        mock_method_pointer2.method_id.method_name = "test_method_2"
-        mock_method_pointer2.file_path = "/test/file.py"
-
-        mock_method_pointer3 = Mock()
-        mock_method_pointer3.method_id.method_name = "test_method_3"
-        mock_method_pointer3.file_path = "/test/file.py"
-
-        mock_call_site_info = Mock()
-        mock_call_site_info.function_node = Mock()
-        mock_call_site_info.file_path = "/test/file.py"
-
-        mock_collect_usages.return_value = {
-            mock_method_pointer1: [mock_call_site_info],
-            mock_method_pointer2: [mock_call_site_info],
-            mock_method_pointer3: [mock_call_site_info],
+        mock_method_pointer1 = method_pointer_factory("test_method_1")
+        mock_method_pointer2 = method_pointer_factory("test_method_2")
+        mock_method_pointer3 = method_pointer_factory("test_method_3")
+
+        worker_mocks["collect_method_usages"].return_value = {
+            mock_method_pointer1: [call_site],
+            mock_method_pointer2: [call_site],
+            mock_method_pointer3: [call_site],
         }
 
-        mock_get_ratings.side_effect = [
+        worker_mocks["get_method_ratings"].side_effect = [
             "API response for method 1",
             "API response for method 2",
             "API response for method 3",
         ]
 
-        with patch("source.codewise_gui.codewise_ui_utils.get_method_body") as mock_get_body:
-            mock_get_body.return_value = "def test_method(): pass"
-
-            worker = AnalysisWorker("/test/root", "/test/file.py")
-
-            progress_signal = Mock()
-            api_response_signal = Mock()
-            finished_signal = Mock()
+        worker = _SyncWorker("/test/root", "/test/file.py")
 
-            worker.progress.connect(progress_signal)
-            worker.api_response.connect(api_response_signal)
-            worker.finished.connect(finished_signal)
+        emitted = _spy(worker, "progress", "api_response", "finished")
 
-            worker.run()
+        worker.run()
 
-            # CRITICAL: Verify that ALL 3 methods were processed
-            assert mock_get_ratings.call_count == 3
+        # CRITICAL: Verify that ALL 3 methods were processed
+        assert worker_mocks["get_method_ratings"].call_count == 3
 
-            # Verify progress for all methods
-            progress_calls = [call[0][0] for call in progress_signal.call_args_list]
-            assert any("Processing method: test_method_1" in call for call in progress_calls)
-            assert any("Processing method: test_method_2" in call for call in progress_calls)
-            assert any("Processing method: test_method_3" in call for call in progress_calls)
+        # Verify progress for all methods
+        progress_messages = [args[0] for args in emitted["progress"]]
+        assert "Processing method: test_method_1" in progress_messages
+        assert "Processing method: test_method_2" in progress_messages
+        assert "Processing method: test_method_3" in progress_messages
 
-            # Verify API responses for all methods
-            api_response_calls = [call[0][0] for call in api_response_signal.call_args_list]
-            assert len(api_response_calls) == 3
-            assert any("Analysis for method: test_method_1" in call for call in api_response_calls)
-            assert any("Analysis for method: test_method_2" in call for call in api_response_calls)
-            assert any("Analysis for method: test_method_3" in call for call in api_response_calls)
+        # Verify API responses for all methods
+        api_response_calls = [args[0] for args in emitted["api_response"]]
+        api_response_blob = "\n".join(api_response_calls)
+        assert len(api_response_calls) == 3
+        assert "Analysis for method: test_method_1" in api_response_blob
+        assert "Analysis for method: test_method_2" in api_response_blob
+        assert "Analysis for method: test_method_3" in api_response_blob
 
-            assert finished_signal.called
+        assert emitted["finished"]
 
-    @patch("source.codewise_gui.codewise_ui_utils.collect_method_usages")
-    @patch("source.codewise_gui.codewise_ui_utils.get_method_ratings")
-    def test_processes_class_methods_and_functions(self, mock_get_ratings, mock_collect_usages):
+    def test_processes_class_methods_and_functions(self, worker_mocks, method_pointer_factory, call_site):
         """Test processing of both class methods and standalone functions"""
-        mock_class_method = Mock()
-        mock_class_method.method_id.method_name = "class_method"
-        mock_class_method.file_path = "/test/file.py"
+        mock_class_method = method_pointer_factory("class_method")
+        mock_function = method_pointer_factory("standalone_function")
 
-        mock_function = Mock()
-        mock_function.method_id.method_name = "standalone_function"
-        mock_function.file_path = "/test/file.py"
-
-        mock_call_site_info = Mock()
-        mock_call_site_info.function_node = Mock()
-        mock_call_site_info.file_path = "/test/file.py"
-
-        mock_collect_usages.return_value = {
-            mock_class_method: [mock_call_site_info],
-            mock_function: [mock_call_site_info],
+        worker_mocks["collect_method_usages"].return_value = {
+            mock_class_method: [call_site],
+            mock_function: [call_site],
         }
 
-        mock_get_ratings.side_effect = ["API response for class method", "API response for function"]
-
-        with patch("source.codewise_gui.codewise_ui_utils.get_method_body") as mock_get_body:
-            mock_get_body.return_value = "def test_method(): pass"
+        worker_mocks["get_method_ratings"].side_effect = ["API response for class method", "API response for function"]
 
-            worker = AnalysisWorker("/test/root", "/test/file.py")
+        worker = _SyncWorker("/test/root", "/test/file.py")
 
-            progress_signal = Mock()
-            api_response_signal = Mock()
+        emitted = _spy(worker, "progress", "api_response")
 
-            worker.progress.connect(progress_signal)
-            worker.api_response.connect(api_response_signal)
-
-            worker.run()
+        worker.run()
 
-            assert mock_get_ratings.call_count == 2
+        assert worker_mocks["get_method_ratings"].call_count == 2
 
-            progress_calls = [call[0][0] for call in progress_signal.call_args_list]
-            assert any("Processing method: class_method" in call for call in progress_calls)
-            assert any("Processing method: standalone_function" in call for call in progress_calls)
+        progress_messages = [args[0] for args in emitted["progress"]]
+        assert "Processing method: class_method" in progress_messages
+        assert "Processing method: standalone_function" in progress_messages
 
 
 class TestAnalysisWorkerErrorHandling:
     """Test error handling during analysis"""
 
-    @patch("source.codewise_gui.codewise_ui_utils.collect_method_usages")
-    @patch("source.codewise_gui.codewise_ui_utils.get_method_ratings")
-    def test_continues_after_api_error(self, mock_get_ratings, mock_collect_usages):
+    def test_continues_after_api_error(self, worker_mocks, method_pointer_factory, call_site):
         """Test that analysis continues even if one API call fails"""
-        mock_method_pointer1 = Mock()
-        mock_method_pointer1.method_id.method_name = "test_method_1"
-        mock_method_pointer1.file_path = "/test/file.py"
-
-        mock_method_pointer2 = Mock()
-        mock_method_pointer2.method_id.method_name = "test_method_2"
-        mock_method_pointer2.file_path = "/test/file.py"
-
-        mock_call_site_info = Mock()
-        mock_call_site_info.function_node = Mock()
-        mock_call_site_info.file_path = "/test/file.py"
+        mock_method_pointer1 = method_pointer_factory("test_method_1")
+        mock_method_pointer2 = method_pointer_factory("test_method_2")
 
-        mock_collect_usages.return_value = {
-            mock_method_pointer1: [mock_call_site_info],
-            mock_method_pointer2: [mock_call_site_info],
+        worker_mocks["collect_method_usages"].return_value = {
+            mock_method_pointer1: [call_site],
+            mock_method_pointer2: [call_site],
         }
 
         # First call fails, second succeeds
-        mock_get_ratings.side_effect = [Exception("API Error for method 1"), "API response for method 2"]
-
-        with patch("source.codewise_gui.codewise_ui_utils.get_method_body") as mock_get_body:
-            mock_get_body.return_value = "def test_method(): pass"
-
-            worker = AnalysisWorker("/test/root", "/test/file.py")
+        worker_mocks["get_method_ratings"].side_effect = [
+            Exception("API Error for method 1"),
+            "API response for method 2",
+        ]
 
-            progress_signal = Mock()
-            api_response_signal = Mock()
-            finished_signal = Mock()
+        worker = _SyncWorker("/test/root", "/test/file.py")
 
-            worker.progress.connect(progress_signal)
-            worker.api_response.connect(api_response_signal)
-            worker.finished.connect(finished_signal)
+        emitted = _spy(worker, "progress", "api_response", "finished")
 
-            worker.run()
+        worker.run()
 
-            # Both API calls were attempted
-            assert mock_get_ratings.call_count == 2
+        # Both API calls were attempted
+        assert worker_mocks["get_method_ratings"].call_count == 2
 
-            # Error logged for first method
-            progress_calls = [call[0][0] for call in progress_signal.call_args_list]
-            assert any("Error calling API for test_method_1" in call for call in progress_calls)
+        # Error logged for first method
+        progress_messages = [args[0] for args in emitted["progress"]]
+        assert "Error calling API for test_method_1: API Error for method 1" in progress_messages
 
-            # Success logged for second method
-            assert any("API call completed for test_method_2" in call for call in progress_calls)
+        # Success logged for second method
+        assert "API call completed for test_method_2" in progress_messages
 
-            # Only successful response emitted
-            api_response_calls = [call[0][0] for call in api_response_signal.call_args_list]
-            assert len(api_response_calls) == 1
-            assert "Analysis for method: test_method_2" in api_response_calls[0]
+        # Only successful response emitted
+        api_response_calls = [args[0] for args in emitted["api_response"]]
+        assert len(api_response_calls) == 1
+        assert "Analysis for method: test_method_2" in api_response_calls[0]
 
-            assert finished_signal.called
+        assert emitted["finished"]
 
 
 class TestAnalysisWorkerCancellation:
     """Test cancellation during analysis"""
 
-    @patch("source.codewise_gui.codewise_ui_utils.collect_method_usages")
-    def test_cancellation_stops_processing(self, mock_collect_usages):
+    def test_cancellation_stops_processing(self, worker_mocks, method_pointer_factory, call_site):
         """Test that cancellation stops processing of remaining methods"""
-        mock_method_pointer1 = Mock()
-        mock_method_pointer1.method_id.method_name = "test_method_1"
-        mock_method_pointer1.file_path = "/test/file.py"
-
-        mock_method_pointer2 = Mock()
-        mock_method_pointer2.method_id.method_name = "test_method_2"
-        mock_method_pointer2.file_path = "/test/file.py"
-
-        mock_method_pointer3 = Mock()
-        mock_method_pointer3.method_id.method_name = "test_method_3"
-        mock_method_pointer3.file_path = "/test/file.py"
-
-        mock_call_site_info = Mock()
-        mock_call_site_info.function_node = Mock()
-        mock_call_site_info.file_path = "/test/file.py"
-
-        mock_collect_usages.return_value = {
-            mock_method_pointer1: [mock_call_site_info],
-            mock_method_pointer2: [mock_call_site_info],
-            mock_method_pointer3: [mock_call_site_info],
+        mock_method_pointer1 = method_pointer_factory("test_method_1")
+        mock_method_pointer2 = method_pointer_factory("test_method_2")
+        mock_method_pointer3 = method_pointer_factory("test_method_3")
+
+        worker_mocks["collect_method_usages"].return_value = {
+            mock_method_pointer1: [call_site],
+            mock_method_pointer2: [call_site],
+            mock_method_pointer3: [call_site],
         }
 
-        with patch("source.codewise_gui.codewise_ui_utils.get_method_body") as mock_get_body:
-            mock_get_body.return_value = "def test_method(): pass"
-
-            worker = AnalysisWorker("/test/root", "/test/file.py")
+        worker = _SyncWorker("/test/root", "/test/file.py")
 
-            # Mock the API call to cancel after first method
-            with patch.object(worker._api_call, "call_api") as mock_call_api:
-                mock_call_api.return_value = "Test API response"
+        # Mock the API call to cancel after first method
+        with patch.object(worker._api_call, "call_api") as mock_call_api:
+            mock_call_api.return_value = "Test API response"
 
-                progress_signal = Mock()
-                api_response_signal = Mock()
-                finished_signal = Mock()
+            emitted = _spy(worker, "progress", "api_response", "finished")
 
-                worker.progress.connect(progress_signal)
-                worker.api_response.connect(api_response_signal)
-                worker.finished.connect(finished_signal)
+            # Cancel after first method
+            def cancel_after_first_method():
+                if mock_call_api.call_count >= 1:
+                    worker.cancel()
 
-                # Cancel after first method
-                def cancel_after_first_method():
-                    if mock_call_api.call_count >= 1:
-                        worker.cancel()
+            def call_api_with_cancel(*args, **kwargs):
+                cancel_after_first_method()
+                return "Test API response"
 
-                def call_api_with_cancel(*args, **kwargs):
-                    cancel_after_first_method()
-                    return "Test API response"
+            mock_call_api.side_effect = call_api_with_cancel
 
-                mock_call_api.side_effect = call_api_with_cancel
-
-                worker.run()
+            worker.run()
 
-                # Only first method should be processed
-                assert mock_call_api.call_count == 1
+            # Only first method should be processed
+            assert mock_call_api.call_count == 1
 
-                # No API responses emitted (cancellation stopped processing)
-                api_response_calls = [call[0][0] for call in api_response_signal.call_args_list]
-                assert len(api_response_calls) == 0
+            # No API responses emitted (cancellation stopped processing)
+            api_response_calls = [args[0] for args in emitted["api_response"]]
+            assert len(api_response_calls) == 0
 
-                # Finished not called due to cancellation
-                assert not finished_signal.called
+            # Finished not called due to cancellation
+            assert not emitted["finished"]
 
-    @patch("source.codewise_gui.codewise_ui_utils.collect_method_usages")
-    @patch("source.codewise_gui.codewise_ui_utils.get_method_ratings")
-    def test_processes_methods_with_multiple_usages(self, mock_get_ratings, mock_collect_usages):
+    def test_processes_methods_with_multiple_usages(self, worker_mocks, method_pointer_factory):
         """Test processing of methods with multiple usage examples"""
-        mock_method_pointer = Mock()
-        mock_method_pointer.method_id.method_name = "test_method"
-        mock_method_pointer.file_path = "/test/file.py"
+        mock_method_pointer = method_pointer_factory("test_method")
 
-        mock_call_site_info1 = Mock()
-        mock_call_site_info1.function_node = Mock()
-        mock_call_site_info1.file_path = "/test/usage1.py"
+        call_site_info1 = CallSiteInfo(call_node=None, function_node=_FN_NODE, file_path="/test/usage1.py")
 
-        mock_call_site_info2 = Mock()
-        mock_call_site_info2.function_node = Mock()
-        mock_call_site_info2.file_path = "/test/usage2.py"
+        call_site_info2 = CallSiteInfo(call_node=None, function_node=_FN_NODE, file_path="/test/usage2.py")
 
-        mock_collect_usages.return_value = {mock_method_pointer: [mock_call_site_info1, mock_call_site_info2]}
+        worker_mocks["collect_method_usages"].return_value = {mock_method_pointer: [call_site_info1, call_site_info2]}
 
-        mock_get_ratings.return_value = "Test API response"
+        worker_mocks["get_method_ratings"].return_value = "Test API response"
 
-        with patch("source.codewise_gui.codewise_ui_utils.get_method_body") as mock_get_body:
+        def get_method_body_side_effect(node, file_path):
+            if file_path == "/test/file.py":
+                return "def test_method(): pass"
+            elif file_path == "/test/usage1.py":
+                return "def usage1(): test_method()"
+            elif file_path == "/test/usage2.py":
+                return "def usage2(): test_method()"
+            return "def unknown(): pass"
 
-            def get_method_body_side_effect(node, file_path):
-                if file_path == "/test/file.py":
-                    return "def test_method(): pass"
-                elif file_path == "/test/usage1.py":
-                    return "def usage1(): test_method()"
-                elif file_path == "/test/usage2.py":
-                    return "def usage2(): test_method()"
-                return "def unknown(): pass"
+        worker_mocks["get_method_body"].side_effect = get_method_body_side_effect
 
-            mock_get_body.side_effect = get_method_body_side_effect
+        worker = _SyncWorker("/test/root", "/test/file.py")
 
-            worker = AnalysisWorker("/test/root", "/test/file.py")
+        emitted = _spy(worker, "progress", "api_response", "finished")
 
-            progress_signal = Mock()
-            api_response_signal = Mock()
-            finished_signal = Mock()
-
-            worker.progress.connect(progress_signal)
-            worker.api_response.connect(api_response_signal)
-            worker.finished.connect(finished_signal)
-
-            worker.run()
+        worker.run()
 
-            # Method body + 2 usage examples
-            assert mock_get_body.call_count == 3
+        # Method body + 2 usage examples
+        assert worker_mocks["get_method_body"].call_count == 3
 
-            # Verify usage examples were included
-            progress_calls = [call[0][0] for call in progress_signal.call_args_list]
-            assert any("Processing method: test_method" in call for call in progress_calls)
-            assert any("Found 2 usage examples" in call for call in progress_calls)
+        # Verify usage examples were included
+        progress_messages = [args[0] for args in emitted["progress"]]
+        assert "Processing method: test_method" in progress_messages
+        assert "Found 2 usage examples" in progress_messages
 
-            api_response_calls = [call[0][0] for call in api_response_signal.call_args_list]
-            assert len(api_response_calls) == 1
-            assert "Analysis for method: test_method" in api_response_calls[0]
+        api_response_calls = [args[0] for args in emitted["api_response"]]
+        assert len(api_response_calls) == 1
+        assert "Analysis for method: test_method" in api_response_calls[0]
 
-            assert finished_signal.called
+        assert emitted["finished"]
 
 
 # ---------------------------------------------------------------------------
@@ -509,63 +475,43 @@ class TestAnalysisWorkerCancelledAtStart:
     """Test run() returns early when already cancelled"""
 
     def test_cancelled_before_run_skips_analysis(self):
-        get_qapp()
         with patch("source.codewise_gui.codewise_ui_utils.collect_method_usages") as mock_collect:
-            worker = AnalysisWorker("/test/root", "/test/file.py")
+            worker = _SyncWorker("/test/root", "/test/file.py")
             worker._is_cancelled = True
 
-            finished = Mock()
-            worker.finished.connect(finished)
+            emitted = _spy(worker, "finished")
 
             worker.run()
 
             mock_collect.assert_not_called()
-            finished.assert_not_called()
+            assert not emitted["finished"]
 
 
 class TestProcessMethodsCancelledError:
     """Test CancelledError during _process_methods is handled"""
 
-    @patch("source.codewise_gui.codewise_ui_utils.collect_method_usages")
-    def test_cancelled_error_stops_processing(self, mock_collect):
-        get_qapp()
-        mp = Mock()
-        mp.method_id.method_name = "my_func"
-        mp.file_path = "/f.py"
-        cs = Mock()
-        cs.function_node = Mock()
-        cs.file_path = "/f.py"
-        mock_collect.return_value = {mp: [cs]}
+    def test_cancelled_error_stops_processing(self, worker_mocks, method_pointer_factory, call_site):
+        mp = method_pointer_factory("my_func", "/f.py")
+        worker_mocks["collect_method_usages"].return_value = {mp: [call_site]}
 
-        with patch("source.codewise_gui.codewise_ui_utils.get_method_body", return_value="def my_func(): pass"):
-            from source.codewise_gui.codewise_ui_utils import CancelledError
+        from source.codewise_gui.codewise_ui_utils import CancelledError
 
-            worker = AnalysisWorker("/test/root", "/test/file.py")
-            with patch.object(worker._api_call, "call_api", side_effect=CancelledError("cancelled")):
-                progress = Mock()
-                worker.progress.connect(progress)
-                worker.run()
+        worker = _SyncWorker("/test/root", "/test/file.py")
+        with patch.object(worker._api_call, "call_api", side_effect=CancelledError("cancelled")):
+            emitted = _spy(worker, "progress")
+            worker.run()
 
-        progress_messages = [c[0][0] for c in progress.call_args_list]
-        assert any("cancelled" in m.lower() for m in progress_messages)
+        progress_messages = [args[0] for args in emitted["progress"]]
+        assert "API call cancelled for my_func" in progress_messages
 
 
 class TestProcessMethodsExceptionContinues:
     """Test that a generic exception in _process_methods emits error and continues"""
 
-    @patch("source.codewise_gui.codewise_ui_utils.collect_method_usages")
-    def test_api_exception_emits_error_message(self, mock_collect):
-        get_qapp()
-        mp1 = Mock()
-        mp1.method_id.method_name = "func1"
-        mp1.file_path = "/f.py"
-        mp2 = Mock()
-        mp2.method_id.method_name = "func2"
-        mp2.file_path = "/f.py"
-        cs = Mock()
-        cs.function_node = Mock()
-        cs.file_path = "/f.py"
-        mock_collect.return_value = {mp1: [cs], mp2: [cs]}
+    def test_api_exception_emits_error_message(self, worker_mocks, method_pointer_factory, call_site):
+        mp1 = method_pointer_factory("func1", "/f.py")
+        mp2 = method_pointer_factory("func2", "/f.py")
+        worker_mocks["collect_method_usages"].return_value = {mp1: [call_site], mp2: [call_site]}
 
         call_count = [0]
 
@@ -575,89 +521,63 @@ class TestProcessMethodsExceptionContinues:
                 raise RuntimeError("API boom")
             return '{"overall_score": 7, "criteria_scores": {}}'
 
-        with patch("source.codewise_gui.codewise_ui_utils.get_method_body", return_value="def f(): pass"):
-            worker = AnalysisWorker("/test/root", "/test/file.py")
-            with patch.object(worker._api_call, "call_api", side_effect=fail_first_then_succeed):
-                progress = Mock()
-                worker.progress.connect(progress)
-                worker.run()
+        worker = _SyncWorker("/test/root", "/test/file.py")
+        with patch.object(worker._api_call, "call_api", side_effect=fail_first_then_succeed):
+            emitted = _spy(worker, "progress")
+            worker.run()
 
-        progress_messages = [c[0][0] for c in progress.call_args_list]
-        assert any("Error calling API" in m for m in progress_messages)
+        progress_messages = [args[0] for args in emitted["progress"]]
+        assert "Error calling API for func1: API boom" in progress_messages
 
 
 class TestProcessMethodsSavesResults:
     """Test that results are saved after _process_methods runs"""
 
-    @patch("source.codewise_gui.codewise_ui_utils.collect_method_usages")
-    @patch("source.codewise_gui.codewise_ui_utils.get_method_ratings")
-    def test_save_path_emitted_in_progress(self, mock_ratings, mock_collect):
-        get_qapp()
-        mp = Mock()
-        mp.method_id.method_name = "func1"
-        mp.file_path = "/f.py"
-        cs = Mock()
-        cs.function_node = Mock()
-        cs.file_path = "/f.py"
-        mock_collect.return_value = {mp: [cs]}
-        mock_ratings.return_value = '{"overall_score": 8, "criteria_scores": {}}'
-
-        with patch("source.codewise_gui.codewise_ui_utils.get_method_body", return_value="def f(): pass"):
-            worker = AnalysisWorker("/test/root", "/test/file.py")
-            mock_storage = Mock()
-            mock_storage.save_analysis_output.return_value = "/tmp/results.json"
-            worker._output_storage = mock_storage
-
-            progress = Mock()
-            worker.progress.connect(progress)
-            worker.run()
+    def test_save_path_emitted_in_progress(self, worker_mocks, method_pointer_factory, call_site):
+        mp = method_pointer_factory("func1", "/f.py")
+        worker_mocks["collect_method_usages"].return_value = {mp: [call_site]}
+        worker_mocks["get_method_ratings"].return_value = '{"overall_score": 8, "criteria_scores": {}}'
+
+        worker = _SyncWorker("/test/root", "/test/file.py")
+        mock_storage = Mock()
+        mock_storage.save_analysis_output.return_value = "/tmp/results.json"
+        worker._output_storage = mock_storage
+
+        emitted = _spy(worker, "progress")
+        worker.run()
 
         mock_storage.save_analysis_output.assert_called_once()
+        assert ("Analysis results saved to: /tmp/results.json",) in emitted["progress"]
 
 
 class TestProcessEntireProjectCancelledError:
     """Test CancelledError in _process_entire_project"""
 
-    @patch("source.codewise_gui.codewise_ui_utils.collect_method_usages_entire_project")
-    def test_cancelled_error_in_entire_project(self, mock_collect):
-        get_qapp()
-        mp = Mock()
-        mp.method_id.method_name = "func1"
-        mp.file_path = "/f.py"
-        cs = Mock()
-        cs.function_node = Mock()
-        cs.file_path = "/f.py"
-        mock_collect.return_value = {"key": (mp, [cs])}
+    def test_cancelled_error_in_entire_project(self, worker_mocks, method_pointer_factory, call_site):
+        mp = method_pointer_factory("func1", "/f.py")
+        worker_mocks["collect_method_usages_entire_project"].return_value = {"key": (mp, [call_site])}
 
         from source.codewise_gui.codewise_ui_utils import CancelledError
 
-        with patch("source.codewise_gui.codewise_ui_utils.get_method_body", return_value="def f(): pass"):
-            worker = AnalysisWorker("/test/root", analysis_mode="entire_project")
-            with patch.object(worker._api_call, "call_api", side_effect=CancelledError("cancelled")):
-                progress = Mock()
-                worker.progress.connect(progress)
-                worker.run()
+        worker = _SyncWorker("/test/root", analysis_mode="entire_project")
+        with patch.object(worker._api_call, "call_api", side_effect=CancelledError("cancelled")):
+            emitted = _spy(worker, "progress")
+            worker.run()
 
-        progress_messages = [c[0][0] for c in progress.call_args_list]
-        assert any("cancelled" in m.lower() for m in progress_messages)
+        progress_messages = [args[0] for args in emitted["progress"]]
+        assert "API call cancelled for func1" in progress_messages
 
 
 class TestProcessEntireProjectExceptionContinues:
     """Test that API exceptions in _process_entire_project emit errors and continue"""
 
-    @patch("source.codewise_gui.codewise_ui_utils.collect_method_usages_entire_project")
-    def test_api_exception_emits_error_and_continues(self, mock_collect):
-        get_qapp()
-        mp1 = Mock()
-        mp1.method_id.method_name = "func1"
-        mp1.file_path = "/f.py"
-        mp2 = Mock()
-        mp2.method_id.method_name = "func2"
-        mp2.file_path = "/g.py"
-        cs = Mock()
-        cs.function_node = Mock()
-        cs.file_path = "/f.py"
-        mock_collect.return_value = {"k1": (mp1, [cs]), "k2": (mp2, [cs])}
+    def test_api_exception_emits_error_and_continues(self, worker_mocks, method_pointer_factory, call_site):
+        mp1 = method_pointer_factory("func1", "/f.py")
+        mp2 = method_pointer_factory("func2", "/g.py")
+        worker_mocks["collect_method_usages_entire_project"].return_value = {
+            "k1": (mp1, [call_site]),
+            "k2": (mp2, [call_site]),
+        }
 
         call_count = [0]
 
@@ -667,12 +587,10 @@ class TestProcessEntireProjectExceptionContinues:
                 raise RuntimeError("boom")
             return '{"overall_score": 7, "criteria_scores": {}}'
 
-        with patch("source.codewise_gui.codewise_ui_utils.get_method_body", return_value="def f(): pass"):
-            worker = AnalysisWorker("/test/root", analysis_mode="entire_project")
-            with patch.object(worker._api_call, "call_api", side_effect=fail_first):
-                progress = Mock()
-                worker.progress.connect(progress)
-                worker.run()
+        worker = _SyncWorker("/test/root", analysis_mode="entire_project")
+        with patch.object(worker._api_call, "call_api", side_effect=fail_first):
+            emitted = _spy(worker, "progress")
+            worker.run()
 
-        progress_messages = [c[0][0] for c in progress.call_args_list]
-        assert any("Error calling API" in m for m in progress_messages)
+        progress_messages = [args[0] for args in emitted["progress"]]
+        assert "Error calling API for func1: boom" in progress_messages
@@ -11,7 +11,6 @@ Tests focus on:
 """
 
 import threading
-import time
 from unittest.mock import patch
 
 import pytest
@@ -111,35 +110,43 @@ class TestCancellableAPICallCancellation:
     def test_cancel_during_api_call(self, mock_get_ratings):
         """Test that cancelling during an API call raises CancelledError"""
         api_call = CancellableAPICall()
+        started = threading.Event()
+        release = threading.Event()
 
-        # Create a slow API call
-        def slow_api_call(prompt, model):
-            time.sleep(2)  # Simulate slow API call
+        # API call that stays in flight until the test releases it
+        def blocking_api_call(prompt, model):
+            started.set()
+            release.wait(5)
             return "Response"
 
-        mock_get_ratings.side_effect = slow_api_call
+        mock_get_ratings.side_effect = blocking_api_call
+        outcome = []
 
         # Start the API call in a thread
         def call_api_in_thread():
             try:
-                api_call.call_api("slow prompt", "gpt-4")
+                outcome.append(api_call.call_api("slow prompt", "gpt-4"))
             except CancelledError:
-                pass  # Expected
+                outcome.append("cancelled")
 
         thread = threading.Thread(target=call_api_in_thread)
         thread.start()
 
-        # Give the call time to start
-        time.sleep(0.2)
+        try:
+            # Wait until the call is actually in flight
+            assert started.wait(2)
 
-        # Cancel the call
-        api_call.cancel()
+            # Cancel the call
+            api_call.cancel()
 
-        # Wait for thread to finish
-        thread.join(timeout=5)
+            # Wait for thread to finish
+            thread.join(timeout=5)
+        finally:
+            release.set()
 
         # Thread should have finished (due to cancellation)
         assert not thread.is_alive()
+        assert outcome == ["cancelled"]
 
     @patch('source.codewise_gui.codewise_ui_utils.get_method_ratings')
     def test_cancel_before_call_raises_error(self, mock_get_ratings):
@@ -205,9 +212,12 @@ class TestCancellableAPICallErrorHandling:
     def test_cancellation_during_error_handling(self, mock_get_ratings):
         """Test that cancellation during error handling is handled correctly"""
         api_call = CancellableAPICall()
+        started = threading.Event()
+        release = threading.Event()
 
         def failing_api_call(prompt, model):
-            time.sleep(0.5)
+            started.set()
+            release.wait(5)
             raise ValueError("API Error")
 
         mock_get_ratings.side_effect = failing_api_call
@@ -222,14 +232,18 @@ class TestCancellableAPICallErrorHandling:
         thread = threading.Thread(target=call_api_in_thread)
         thread.start()
 
-        # Give call time to start
-        time.sleep(0.1)
+        try:
+            # Wait until the call is in flight
+            assert started.wait(2)
 
-        # Cancel while error is being handled
-        api_call.cancel()
+            # Cancel, then let the API call fail
+            api_call.cancel()
+            release.set()
 
-        # Wait for thread
-        thread.join(timeout=5)
+            # Wait for thread
+            thread.join(timeout=5)
+        finally:
+            release.set()
 
         # Thread should finish
         assert not thread.is_alive()
@@ -242,12 +256,15 @@ class TestCancellableAPICallThreadSafety:
     def test_concurrent_cancellation_is_safe(self, mock_get_ratings):
         """Test that concurrent cancellation doesn't cause race conditions"""
         api_call = CancellableAPICall()
+        started = threading.Event()
+        release = threading.Event()
 
-        def slow_api_call(prompt, model):
-            time.sleep(1)
+        def blocking_api_call(prompt, model):
+            started.set()
+            release.wait(5)
             return "Response"
 
-        mock_get_ratings.side_effect = slow_api_call
+        mock_get_ratings.side_effect = blocking_api_call
 
         # Start API call
         api_thread = threading.Thread(
@@ -255,16 +272,19 @@ class TestCancellableAPICallThreadSafety:
         )
         api_thread.start()
 
-        # Give it time to start
-        time.sleep(0.1)
-
-        # Cancel from another thread
-        cancel_thread = threading.Thread(target=api_call.cancel)
-        cancel_thread.start()
-
-        # Wait for both threads
-        api_thread.join(timeout=5)
-        cancel_thread.join(timeout=5)
+        try:
+            # Wait until the call is in flight
+            assert started.wait(2)
+
+            # Cancel from another thread
+            cancel_thread = threading.Thread(target=api_call.cancel)
+            cancel_thread.start()
+
+            # Wait for both threads
+            api_thread.join(timeout=5)
+            cancel_thread.join(timeout=5)
+        finally:
+            release.set()
 
         # Both should finish without deadlock
         assert not api_thread.is_alive()
@@ -10,41 +10,122 @@ Tests focus on:
 6. Event handling (finished, errors, cancellation)
 """
 
-from unittest.mock import Mock, patch
-
-from source.codewise_gui.codewise_ui_utils import CodewiseApp
-
-# Import the shared fixtures and helper from test_ui_utils
-from .test_ui_utils import get_qapp, suppress_message_boxes  # noqa: F401
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QFileDialog, QLabel, QLineEdit, QMessageBox, QPushButton, QTextEdit
+
+from source.codewise_gui import codewise_ui_utils
+from source.codewise_gui.codewise_ui_utils import CodewiseApp, LoadingSpinner
+
+
+@pytest.fixture
+def file_dialogs(monkeypatch):
+    """Replace the QFileDialog pickers with mocks so no native dialog is opened"""
+    mock_directory = Mock(return_value="")
+    mock_open_file = Mock(return_value=("", ""))
+
+    monkeypatch.setattr(QFileDialog, 'getExistingDirectory', mock_directory)
+    monkeypatch.setattr(QFileDialog, 'getOpenFileName', mock_open_file)
+
+    return SimpleNamespace(directory=mock_directory, open_file=mock_open_file)
+
+
+@pytest.fixture(scope="class")
+def _shared_codewise_app(qapp):
+    """One CodewiseApp per test class; building the full widget tree for every test dominates GUI test time"""
+    app = CodewiseApp()
+    yield app
+    app.close()
+    app.deleteLater()
+
+
+@pytest.fixture
+def codewise_app(_shared_codewise_app):
+    """The class-shared CodewiseApp, put back into its just-constructed state after each test"""
+    app = _shared_codewise_app
+    yield app
+    app.reset_ui_after_cancel()
+    app.output_text.clear()
+    app.progress_label.setText("Status: Idle")
+    app.root_dir_entry.clear()
+    app.file_path_entry.clear()
+    app.single_file_radio.setChecked(True)
+    app.on_analysis_mode_selected()
+    app.hide()
+
+
+@pytest.fixture
+def mock_worker_class(monkeypatch):
+    """Replace AnalysisWorker with a Mock class; the worker on_submit builds is its return_value"""
+    worker_class = Mock()
+    monkeypatch.setattr(codewise_ui_utils, "AnalysisWorker", worker_class)
+    return worker_class
+
+
+# Child widgets CodewiseApp handlers touch, with the widget class each mock is spec'd against
+_APP_WIDGETS = {
+    "output_text": QTextEdit,
+    "progress_label": QLabel,
+    "api_response_text": QTextEdit,
+    "spinner": LoadingSpinner,
+    "submit_btn": QPushButton,
+    "cancel_btn": QPushButton,
+    "browse_root_btn": QPushButton,
+    "browse_file_btn": QPushButton,
+    "root_dir_entry": QLineEdit,
+    "file_path_entry": QLineEdit,
+}
+
+
+def make_app_mock(**attrs):
+    """Mock(spec=CodewiseApp) carrying spec'd child widget mocks, for handlers that only talk to those widgets.
+
+    Call handlers unbound, e.g. ``CodewiseApp.update_progress(app_mock, "msg")``, so no Qt widget tree is built.
+    Other CodewiseApp methods are spec'd mocks, so calls between handlers can be asserted directly, and a
+    misspelled widget method fails loudly instead of returning a fresh child mock.
+    """
+    app_mock = Mock(spec=CodewiseApp)
+    app_mock.worker = None
+    for name, widget_cls in _APP_WIDGETS.items():
+        setattr(app_mock, name, Mock(spec=widget_cls))
+    for name, value in attrs.items():
+        setattr(app_mock, name, value)
+    return app_mock
+
+
+@pytest.fixture
+def submit_harness():
+    """Widget-free stand-in for driving CodewiseApp.on_submit; both entries start empty and nothing is cached"""
+    harness = make_app_mock(analysis_mode="single_file", _output_storage=Mock())
+    harness.root_dir_entry.text.return_value = ""
+    harness.file_path_entry.text.return_value = ""
+    harness._output_storage.output_exists.return_value = False
+    return harness
 
 
 class TestCodewiseAppInitialization:
     """Test CodewiseApp initialization and component creation"""
 
-    def test_app_initialization(self):
+    def test_app_initialization(self, codewise_app):
         """Test that the app initializes correctly"""
-        get_qapp()
-        codewise_app = CodewiseApp()
 
         assert codewise_app.worker is None
         assert codewise_app.spinner is not None
         assert codewise_app.progress_label is not None
         assert codewise_app.submit_btn is not None
 
-    def test_styled_label_creation(self):
+    def test_styled_label_creation(self, qapp):
         """Test that styled labels are created correctly"""
-        get_qapp()
-        codewise_app = CodewiseApp()
-        label = codewise_app._styled_label("Test Label")
+        label = CodewiseApp._styled_label("Test Label")
 
         assert label.text() == "Test Label"
         assert "font-weight: 600" in label.styleSheet()
 
-    def test_analysis_mode_initialization(self):
+    def test_analysis_mode_initialization(self, codewise_app):
         """Test that analysis mode is initialized correctly"""
-        get_qapp()
-        codewise_app = CodewiseApp()
-
         # Check default mode
         assert codewise_app.analysis_mode == "single_file"
         assert codewise_app.single_file_radio.isChecked()
@@ -54,186 +135,114 @@ class TestCodewiseAppInitialization:
 class TestCodewiseAppFileSelection:
     """Test file and directory selection dialogs"""
 
-    @patch("PySide6.QtWidgets.QFileDialog.getExistingDirectory")
-    def test_select_root_directory(self, mock_dialog):
+    def test_select_root_directory(self, file_dialogs, codewise_app):
         """Test root directory selection"""
-        get_qapp()
-        mock_dialog.return_value = "/test/directory"
-
-        codewise_app = CodewiseApp()
+        file_dialogs.directory.return_value = "/test/directory"
         codewise_app.select_root_directory()
 
         assert codewise_app.root_dir_entry.text() == "/test/directory"
 
-    @patch("PySide6.QtWidgets.QFileDialog.getOpenFileName")
-    def test_select_file(self, mock_dialog):
+    def test_select_file(self, file_dialogs, codewise_app):
         """Test file selection"""
-        get_qapp()
-        mock_dialog.return_value = ("/test/file.py", "")
-
-        codewise_app = CodewiseApp()
+        file_dialogs.open_file.return_value = ("/test/file.py", "")
         codewise_app.select_file()
 
         assert codewise_app.file_path_entry.text() == "/test/file.py"
 
 
+_MODE_RADIOS = {"single_file": "single_file_radio", "entire_project": "entire_project_radio"}
+
+
 class TestCodewiseAppAnalysisMode:
     """Test analysis mode switching and UI state management"""
 
-    def test_single_file_mode_selection(self):
-        """Test single file mode selection"""
-        get_qapp()
-        codewise_app = CodewiseApp()
-        codewise_app.show()  # Ensure widget is shown for visibility checks
-
-        # Initially, single file mode should be selected by default
+    @staticmethod
+    def _assert_file_controls(app, shown):
+        """File path controls are visible and enabled only in single file mode"""
+        assert app.file_path_label.isVisible() is shown
+        assert app.file_path_entry.isVisible() is shown
+        assert app.file_path_entry.isEnabled() is shown
+        assert app.browse_file_btn.isVisible() is shown
+        assert app.browse_file_btn.isEnabled() is shown
+
+    @pytest.mark.parametrize(
+        "sequence",
+        [
+            ["single_file"],
+            ["entire_project"],
+            ["entire_project", "single_file"],
+        ],
+        ids=["select-single-file", "select-entire-project", "switch-and-back"],
+    )
+    def test_mode_selection(self, codewise_app, sequence):
+        """Selecting each mode in turn updates the mode and file path controls"""
+        # Ensure widget is shown for visibility checks, without creating a native window
+        codewise_app.setAttribute(Qt.WA_DontShowOnScreen, True)
+        codewise_app.show()
+
+        # Single file mode is selected by default with file path elements visible
         assert codewise_app.analysis_mode == "single_file"
         assert codewise_app.single_file_radio.isChecked()
+        self._assert_file_controls(codewise_app, shown=True)
 
-        # Check file path elements are visible by default
-        assert codewise_app.file_path_label.isVisible()
-        assert codewise_app.file_path_entry.isVisible()
-        assert codewise_app.file_path_entry.isEnabled()
-        assert codewise_app.browse_file_btn.isVisible()
-        assert codewise_app.browse_file_btn.isEnabled()
-
-        # Explicitly select single file mode
-        codewise_app.single_file_radio.setChecked(True)
-        codewise_app.on_analysis_mode_selected()
-
-        # Check mode is set correctly
-        assert codewise_app.analysis_mode == "single_file"
-
-        # Check file path elements are still visible
-        assert codewise_app.file_path_label.isVisible()
-        assert codewise_app.file_path_entry.isVisible()
-        assert codewise_app.file_path_entry.isEnabled()
-        assert codewise_app.browse_file_btn.isVisible()
-        assert codewise_app.browse_file_btn.isEnabled()
-
-    def test_entire_project_mode_selection(self):
-        """Test entire project mode selection"""
-        get_qapp()
-        codewise_app = CodewiseApp()
-
-        # Select entire project mode
-        codewise_app.entire_project_radio.setChecked(True)
-        codewise_app.on_analysis_mode_selected()
-
-        # Check mode is set correctly
-        assert codewise_app.analysis_mode == "entire_project"
-
-        # Check file path elements are hidden
-        assert not codewise_app.file_path_label.isVisible()
-        assert not codewise_app.file_path_entry.isVisible()
-        assert not codewise_app.file_path_entry.isEnabled()
-        assert not codewise_app.browse_file_btn.isVisible()
-        assert not codewise_app.browse_file_btn.isEnabled()
-
-    def test_mode_switching(self):
-        """Test switching between modes"""
-        get_qapp()
-        codewise_app = CodewiseApp()
-        codewise_app.show()  # Ensure widget is shown for visibility checks
-
-        # Start with single file mode (default)
-        assert codewise_app.analysis_mode == "single_file"
-        assert codewise_app.file_path_label.isVisible()
-
-        # Switch to entire project mode
-        codewise_app.entire_project_radio.setChecked(True)
-        codewise_app.on_analysis_mode_selected()
-        assert codewise_app.analysis_mode == "entire_project"
-        assert not codewise_app.file_path_label.isVisible()
+        for mode in sequence:
+            getattr(codewise_app, _MODE_RADIOS[mode]).setChecked(True)
+            codewise_app.on_analysis_mode_selected()
 
-        # Switch back to single file mode
-        codewise_app.single_file_radio.setChecked(True)
-        codewise_app.on_analysis_mode_selected()
-        assert codewise_app.analysis_mode == "single_file"
-        assert codewise_app.file_path_label.isVisible()
+            assert codewise_app.analysis_mode == mode
+            self._assert_file_controls(codewise_app, shown=mode == "single_file")
 
 
 class TestCodewiseAppSubmission:
     """Test form submission and validation"""
 
-    def test_on_submit_validation_empty_fields(self):
+    def test_on_submit_validation_empty_fields(self, message_box_mocks, submit_harness):
         """Test submit validation with empty fields"""
-        get_qapp()
-        codewise_app = CodewiseApp()
-
-        # Mock QMessageBox to avoid actual dialog
-        with patch("PySide6.QtWidgets.QMessageBox.warning") as mock_warning:
-            codewise_app.on_submit()
+        CodewiseApp.on_submit(submit_harness)
 
-            # Should show warning for empty fields
-            assert mock_warning.called
+        # Should show warning for empty fields
+        assert message_box_mocks.warning.called
 
-    def test_on_submit_missing_root_directory(self):
+    def test_on_submit_missing_root_directory(self, message_box_mocks, submit_harness):
         """Test submit validation when root directory is missing"""
-        get_qapp()
-        codewise_app = CodewiseApp()
+        submit_harness.file_path_entry.text.return_value = "/test/file.py"
 
         # Test with no root directory
-        with patch("PySide6.QtWidgets.QMessageBox.warning") as mock_warning:
-            codewise_app.on_submit()
-            mock_warning.assert_called_once()
+        CodewiseApp.on_submit(submit_harness)
+        message_box_mocks.warning.assert_called_once()
 
-    def test_on_submit_success_single_file(self):
+    def test_on_submit_success_single_file(self, message_box_mocks, submit_harness, mock_worker_class):
         """Test successful submit in single file mode"""
-        get_qapp()
-
-        with patch("source.codewise_gui.codewise_ui_utils.AnalysisWorker") as mock_worker_class:
-            mock_worker = Mock()
-            mock_worker_class.return_value = mock_worker
+        submit_harness.root_dir_entry.text.return_value = "/test/root"
+        submit_harness.file_path_entry.text.return_value = "/test/file.py"
 
-            codewise_app = CodewiseApp()
-            codewise_app.analysis_mode = "single_file"
-            codewise_app.root_dir_entry.setText("/test/root")
-            codewise_app.file_path_entry.setText("/test/file.py")
-            codewise_app._output_storage = Mock()
-            codewise_app._output_storage.output_exists.return_value = False
+        CodewiseApp.on_submit(submit_harness)
 
-            with patch("PySide6.QtWidgets.QMessageBox.warning", return_value=None):
-                codewise_app.on_submit()
+        # Verify worker was created and started
+        mock_worker = mock_worker_class.return_value
+        mock_worker_class.assert_called_once_with("/test/root", "/test/file.py", "single_file")
+        mock_worker.progress.connect.assert_called_once_with(submit_harness.update_progress)
+        assert mock_worker.start.called
+        message_box_mocks.warning.assert_not_called()
 
-                # Verify worker was created and started
-                mock_worker_class.assert_called_once_with("/test/root", "/test/file.py", "single_file")
-                assert mock_worker.start.called
-
-    def test_on_submit_single_file_mode_requires_file_path(self):
+    def test_on_submit_single_file_mode_requires_file_path(self, message_box_mocks, submit_harness):
         """Test that single file mode requires both root and file path"""
-        get_qapp()
-        codewise_app = CodewiseApp()
-
-        # Set single file mode
-        codewise_app.analysis_mode = "single_file"
-        codewise_app.root_dir_entry.setText("/test/root")
+        submit_harness.root_dir_entry.text.return_value = "/test/root"
 
         # Test missing file path
-        with patch("PySide6.QtWidgets.QMessageBox.warning") as mock_warning:
-            codewise_app.on_submit()
-            mock_warning.assert_called_once()
+        CodewiseApp.on_submit(submit_harness)
+        message_box_mocks.warning.assert_called_once()
 
-    def test_on_submit_entire_project_mode(self):
+    def test_on_submit_entire_project_mode(self, submit_harness, mock_worker_class):
         """Test submit in entire project mode"""
-        get_qapp()
-        codewise_app = CodewiseApp()
-
-        # Set entire project mode
-        codewise_app.analysis_mode = "entire_project"
-        codewise_app.root_dir_entry.setText("/test/root")
-        codewise_app._output_storage = Mock()
-        codewise_app._output_storage.output_exists.return_value = False
+        submit_harness.analysis_mode = "entire_project"
+        submit_harness.root_dir_entry.text.return_value = "/test/root"
 
         # Test with root directory only
-        with patch("source.codewise_gui.codewise_ui_utils.AnalysisWorker") as mock_worker_class:
-            mock_worker = Mock()
-            mock_worker_class.return_value = mock_worker
+        CodewiseApp.on_submit(submit_harness)
 
-            codewise_app.on_submit()
-
-            # Verify worker was created with entire project mode
-            mock_worker_class.assert_called_once_with("/test/root", None, "entire_project")
+        # Verify worker was created with entire project mode
+        mock_worker_class.assert_called_once_with("/test/root", None, "entire_project")
 
 
 class TestCodewiseAppUpdates:
@@ -241,180 +250,129 @@ class TestCodewiseAppUpdates:
 
     def test_update_progress(self):
         """Test progress update functionality"""
-        get_qapp()
-        codewise_app = CodewiseApp()
-
-        # Mock the output text widget
-        codewise_app.output_text = Mock()
-        codewise_app.progress_label = Mock()
+        app_mock = make_app_mock()
 
-        codewise_app.update_progress("Test message")
+        CodewiseApp.update_progress(app_mock, "Test message")
 
         # Verify both output text and progress label were updated
-        codewise_app.output_text.append.assert_called_with("Test message\n")
-        codewise_app.progress_label.setText.assert_called_with("Status: Test message")
+        app_mock.output_text.append.assert_called_with("Test message\n")
+        app_mock.progress_label.setText.assert_called_with("Status: Test message")
 
     def test_update_api_response(self):
         """Test API response update functionality"""
-        get_qapp()
-        codewise_app = CodewiseApp()
+        app_mock = make_app_mock()
 
-        # Mock the API response text widget and spinner
-        codewise_app.api_response_text = Mock()
-        codewise_app.spinner = Mock()
-
-        codewise_app.update_api_response("Test API response")
+        CodewiseApp.update_api_response(app_mock, "Test API response")
 
         # Verify API response text was updated but spinner was NOT stopped
-        codewise_app.api_response_text.setText.assert_called_with("Test API response")
-        codewise_app.spinner.stop_spinning.assert_not_called()
-        codewise_app.spinner.setVisible.assert_not_called()
-
-    def test_update_api_response_no_spinner_stop(self):
-        """Test that update_api_response doesn't stop the spinner"""
-        get_qapp()
-        codewise_app = CodewiseApp()
-
-        # Mock the API response text
-        mock_api_text = Mock()
-        codewise_app.api_response_text = mock_api_text
-
-        # Mock the spinner
-        mock_spinner = Mock()
-        codewise_app.spinner = mock_spinner
-
-        # Call update_api_response
-        codewise_app.update_api_response("Test API response")
-
-        # Verify API response text was set
-        mock_api_text.setText.assert_called_once_with("Test API response")
-
-        # Verify spinner was NOT stopped (this is the key change)
-        mock_spinner.stop_spinning.assert_not_called()
-        mock_spinner.setVisible.assert_not_called()
+        app_mock.api_response_text.setText.assert_called_with("Test API response")
+        app_mock.spinner.stop_spinning.assert_not_called()
+        app_mock.spinner.setVisible.assert_not_called()
 
 
 class TestCodewiseAppEventHandling:
     """Test event handlers for analysis completion and errors"""
 
-    def test_on_analysis_finished(self):
+    def test_on_analysis_finished(self, message_box_mocks):
         """Test analysis finished handling"""
-        get_qapp()
-        codewise_app = CodewiseApp()
-
-        # Mock components
-        codewise_app.output_text = Mock()
-        codewise_app.spinner = Mock()
-        codewise_app.submit_btn = Mock()
-
-        # Mock QMessageBox to avoid actual dialog
-        with patch("PySide6.QtWidgets.QMessageBox.information") as mock_info:
-            codewise_app.on_analysis_finished("Test completion message")
-
-            # Verify all components were updated correctly
-            codewise_app.output_text.append.assert_called_with("Test completion message\n")
-            codewise_app.spinner.stop_spinning.assert_called()
-            codewise_app.spinner.setVisible.assert_called_with(False)
-            codewise_app.submit_btn.setEnabled.assert_called_with(True)
-            mock_info.assert_called()
-
-    def test_on_analysis_error(self):
-        """Test analysis error handling"""
-        get_qapp()
-        codewise_app = CodewiseApp()
+        app_mock = make_app_mock()
+
+        CodewiseApp.on_analysis_finished(app_mock, "Test completion message")
 
-        # Mock components
-        codewise_app.output_text = Mock()
-        codewise_app.spinner = Mock()
-        codewise_app.submit_btn = Mock()
+        # Verify all components were updated correctly
+        app_mock.output_text.append.assert_called_with("Test completion message\n")
+        app_mock.spinner.stop_spinning.assert_called()
+        app_mock.spinner.setVisible.assert_called_with(False)
+        app_mock.submit_btn.setEnabled.assert_called_with(True)
+        message_box_mocks.info.assert_called()
+
+    def test_on_analysis_error(self, message_box_mocks):
+        """Test analysis error handling"""
+        app_mock = make_app_mock()
 
-        # Mock QMessageBox to avoid actual dialog
-        with patch("PySide6.QtWidgets.QMessageBox.critical") as mock_critical:
-            codewise_app.on_analysis_error("Test error message")
+        CodewiseApp.on_analysis_error(app_mock, "Test error message")
 
-            # Verify all components were updated correctly
-            codewise_app.output_text.append.assert_called_with("Error: Test error message\n")
-            codewise_app.spinner.stop_spinning.assert_called()
-            codewise_app.spinner.setVisible.assert_called_with(False)
-            codewise_app.submit_btn.setEnabled.assert_called_with(True)
-            mock_critical.assert_called()
+        # Verify all components were updated correctly
+        app_mock.output_text.append.assert_called_with("Error: Test error message\n")
+        app_mock.spinner.stop_spinning.assert_called()
+        app_mock.spinner.setVisible.assert_called_with(False)
+        app_mock.submit_btn.setEnabled.assert_called_with(True)
+        message_box_mocks.critical.assert_called()
 
     def test_on_cancel(self):
         """Test cancel functionality"""
-        get_qapp()
-        codewise_app = CodewiseApp()
+        app_mock = make_app_mock(worker=Mock())
 
-        # Mock worker and components
-        codewise_app.worker = Mock()
-        codewise_app.spinner = Mock()
-        codewise_app.submit_btn = Mock()
+        CodewiseApp.on_cancel(app_mock)
 
-        codewise_app.on_cancel()
+        # on_cancel just calls reset_ui_after_cancel
+        app_mock.reset_ui_after_cancel.assert_called_once_with()
 
-        # Verify UI was reset (on_cancel just calls reset_ui_after_cancel)
-        codewise_app.spinner.stop_spinning.assert_called()
-        codewise_app.spinner.setVisible.assert_called_with(False)
-        codewise_app.submit_btn.setEnabled.assert_called_with(True)
+    def test_reset_ui_after_cancel(self):
+        """Test that resetting after a cancel stops the spinner and re-enables submission"""
+        app_mock = make_app_mock(worker=Mock(), _cancelled=True)
+
+        CodewiseApp.reset_ui_after_cancel(app_mock)
+
+        app_mock.spinner.stop_spinning.assert_called()
+        app_mock.spinner.setVisible.assert_called_with(False)
+        app_mock.submit_btn.setEnabled.assert_called_with(True)
+        assert app_mock.worker is None
+        assert app_mock._cancelled is False
 
 
 class TestOnSubmitCacheFlow:
     """Tests for the on_submit cache-hit flow (lines 714-788)"""
 
-    def _make_app_with_cache(self, cached_data, change_info=None):
-        get_qapp()
-        app = CodewiseApp()
+    def _make_app_with_cache(self, app, monkeypatch, cached_data, change_info=None):
         app.root_dir_entry.setText("/test/root")
         app.file_path_entry.setText("/test/file.py")
-        app.analysis_mode = "single_file"
+        monkeypatch.setattr(app, "analysis_mode", "single_file")
 
         storage = Mock()
         storage.output_exists.return_value = True
         storage.get_analysis_output_path.return_value = "/tmp/cache/results.json"
         storage.load_analysis_output.return_value = cached_data
         storage.detect_repo_changes.return_value = change_info
-        app._output_storage = storage
+        monkeypatch.setattr(app, "_output_storage", storage)
         return app
 
-    def test_cache_hit_user_chooses_yes_loads_results(self):
+    def test_cache_hit_user_chooses_yes_loads_results(self, codewise_app, monkeypatch, mock_worker_class):
         """User clicks Yes → cached results are displayed without re-running"""
-        from PySide6.QtWidgets import QMessageBox
-
         cached_data = {
             "results": [
                 {"method_name": "foo", "structured_response": {"overall_score": 8, "overall_feedback": "ok"}},
             ],
             "timestamp": "2024-01-01T00:00:00",
         }
-        app = self._make_app_with_cache(cached_data)
+        app = self._make_app_with_cache(codewise_app, monkeypatch, cached_data)
 
-        with patch("source.codewise_gui.codewise_ui_utils.AnalysisWorker") as mock_worker_class:
-            with patch.object(QMessageBox, "question", return_value=QMessageBox.Yes):
-                with patch.object(QMessageBox, "information"):
-                    app.on_submit()
+        monkeypatch.setattr(QMessageBox, "question", Mock(return_value=QMessageBox.Yes))
 
-            mock_worker_class.assert_not_called()
+        app.on_submit()
 
-    def test_cache_hit_user_chooses_no_reruns(self):
-        """User clicks No → analysis runs fresh"""
-        from PySide6.QtWidgets import QMessageBox
+        mock_worker_class.assert_not_called()
+        # The already-loaded cache is handed to change detection instead of being read again
+        app._output_storage.detect_repo_changes.assert_called_once_with(
+            "/test/root", "/test/file.py", "single_file", cached_data=cached_data
+        )
 
+    def test_cache_hit_user_chooses_no_reruns(self, codewise_app, monkeypatch, mock_worker_class):
+        """User clicks No → analysis runs fresh"""
         cached_data = {
             "results": [{"method_name": "foo", "structured_response": {}}],
             "timestamp": "2024-01-01T00:00:00",
         }
-        app = self._make_app_with_cache(cached_data)
+        app = self._make_app_with_cache(codewise_app, monkeypatch, cached_data)
 
-        mock_worker = Mock()
-        with patch("source.codewise_gui.codewise_ui_utils.AnalysisWorker", return_value=mock_worker):
-            with patch.object(QMessageBox, "question", return_value=QMessageBox.No):
-                app.on_submit()
+        monkeypatch.setattr(QMessageBox, "question", Mock(return_value=QMessageBox.No))
 
-            mock_worker.start.assert_called_once()
+        app.on_submit()
 
-    def test_cache_hit_with_repo_changes_shows_warning_in_dialog(self):
-        """When repo has changed, dialog title reflects changes"""
-        from PySide6.QtWidgets import QMessageBox
+        mock_worker_class.return_value.start.assert_called_once()
 
+    def test_cache_hit_with_repo_changes_shows_warning_in_dialog(self, codewise_app, monkeypatch, mock_worker_class):
+        """When repo has changed, dialog title reflects changes"""
         cached_data = {
             "results": [],
             "timestamp": "2024-01-01T00:00:00",
@@ -424,79 +382,66 @@ class TestOnSubmitCacheFlow:
             "changes": {"added": ["new.py"], "removed": [], "modified": ["old.py"]},
             "cached_timestamp": "2024-01-01",
         }
-        app = self._make_app_with_cache(cached_data, change_info=change_info)
+        app = self._make_app_with_cache(codewise_app, monkeypatch, cached_data, change_info=change_info)
+
+        dialog_kwargs = {}
 
-        with patch("source.codewise_gui.codewise_ui_utils.AnalysisWorker") as mock_worker_class:
-            mock_worker_class.return_value = Mock()
-            dialog_kwargs = {}
+        def capture_question(parent, title, msg, buttons):
+            dialog_kwargs["title"] = title
+            return QMessageBox.No
 
-            def capture_question(parent, title, msg, buttons):
-                dialog_kwargs["title"] = title
-                return QMessageBox.No
+        monkeypatch.setattr(QMessageBox, "question", capture_question)
 
-            with patch.object(QMessageBox, "question", side_effect=capture_question):
-                app.on_submit()
+        app.on_submit()
 
         assert "Changed" in dialog_kwargs.get("title", "") or "change" in dialog_kwargs.get("title", "").lower()
 
-    def test_cache_hit_old_format_fallback(self):
+    def test_cache_hit_old_format_fallback(self, codewise_app, monkeypatch, mock_worker_class):
         """Cached results with old format (api_response only) load without error"""
-        from PySide6.QtWidgets import QMessageBox
-
         cached_data = {
             "results": [{"method_name": "bar", "api_response": "Score: 8/10"}],
             "timestamp": "2024-01-01T00:00:00",
         }
-        app = self._make_app_with_cache(cached_data)
+        app = self._make_app_with_cache(codewise_app, monkeypatch, cached_data)
+
+        monkeypatch.setattr(QMessageBox, "question", Mock(return_value=QMessageBox.Yes))
 
-        with patch("source.codewise_gui.codewise_ui_utils.AnalysisWorker"):
-            with patch.object(QMessageBox, "question", return_value=QMessageBox.Yes):
-                with patch.object(QMessageBox, "information"):
-                    app.on_submit()
+        app.on_submit()
 
 
 class TestOnAnalysisFinishedAndErrorWhenCancelled:
     """on_analysis_finished/error return early when _cancelled=True"""
 
     def test_on_analysis_finished_returns_early_if_cancelled(self):
-        get_qapp()
-        app = CodewiseApp()
-        app._cancelled = True
-        app.output_text = Mock()
-        app.spinner = Mock()
+        app_mock = make_app_mock(_cancelled=True)
 
-        app.on_analysis_finished("done")
+        CodewiseApp.on_analysis_finished(app_mock, "done")
 
-        app.output_text.append.assert_not_called()
+        app_mock.output_text.append.assert_not_called()
 
     def test_on_analysis_error_returns_early_if_cancelled(self):
-        get_qapp()
-        app = CodewiseApp()
-        app._cancelled = True
-        app.output_text = Mock()
-        app.spinner = Mock()
+        app_mock = make_app_mock(_cancelled=True)
 
-        app.on_analysis_error("something went wrong")
+        CodewiseApp.on_analysis_error(app_mock, "something went wrong")
 
-        app.output_text.append.assert_not_called()
+        app_mock.output_text.append.assert_not_called()
 
 
 class TestOnSubmitExceptionHandling:
     """on_submit gracefully handles exceptions when starting the worker"""
 
-    def test_exception_during_worker_start_resets_ui(self):
-        get_qapp()
-        app = CodewiseApp()
+    def test_exception_during_worker_start_resets_ui(self, codewise_app, monkeypatch, mock_worker_class):
+        app = codewise_app
         app.root_dir_entry.setText("/test/root")
         app.file_path_entry.setText("/test/file.py")
-        app.analysis_mode = "single_file"
+        monkeypatch.setattr(app, "analysis_mode", "single_file")
 
         storage = Mock()
         storage.output_exists.return_value = False
-        app._output_storage = storage
+        monkeypatch.setattr(app, "_output_storage", storage)
 
-        with patch("source.codewise_gui.codewise_ui_utils.AnalysisWorker", side_effect=RuntimeError("crash")):
-            app.on_submit()
+        mock_worker_class.side_effect = RuntimeError("crash")
+        app.on_submit()
 
         # UI should not be stuck in a broken state — submit button re-enabled via reset_ui_after_cancel
         # No assertion needed if it didn't raise; just verifying graceful handling
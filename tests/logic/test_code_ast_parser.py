@@ -7,20 +7,23 @@ from source.logic.code_ast_parser import return_function_text
 from source.utils.parse_helper import parse_arguments
 
 
-def test_return_function_text():
-    # Define the source code
+@pytest.fixture(scope="session")
+def example_ast():
+    """Parse the example function once per session; returns (source_code, function_node)"""
     source_code = """
 def example_function():
     x = 10
     y = 20
     return x + y
 """
-
-    # Parse the source code into an AST
     tree = ast.parse(source_code)
+    # The snippet's only top-level statement is the function definition
+    enclosing_function = tree.body[0] if tree.body and isinstance(tree.body[0], ast.FunctionDef) else None
+    return source_code, enclosing_function
+
 
-    # Get the first function definition from the parsed AST
-    enclosing_function = next((node for node in ast.walk(tree) if isinstance(node, ast.FunctionDef)), None)
+def test_return_function_text(example_ast):
+    source_code, enclosing_function = example_ast
 
     # Ensure the AST node for the function is valid
     assert enclosing_function is not None
@@ -40,7 +43,7 @@ def test_return_function_text_no_function():
     assert result is None
 
 
-def test_parse_arguments_valid():
+def test_parse_arguments_valid(monkeypatch):
     """Test that parse_arguments correctly parses valid input arguments."""
     test_args = [
         "script_name",
@@ -48,8 +51,8 @@ def test_parse_arguments_valid():
         "/Users/behrooz/Work/recall-api/api/spam/logic/spam_prevention.py",
     ]
 
-    # Temporarily replace sys.argv
-    sys.argv = test_args
+    # Temporarily replace sys.argv; monkeypatch restores it on teardown
+    monkeypatch.setattr(sys, "argv", test_args)
 
     args = parse_arguments()
 
@@ -57,30 +60,21 @@ def test_parse_arguments_valid():
     assert args.file_path == "/Users/behrooz/Work/recall-api/api/spam/logic/spam_prevention.py"
 
 
-def test_parse_arguments_missing_required_args():
-    """Test that parse_arguments raises a SystemExit error when required arguments are missing."""
-    test_args = [
-        "script_name",
-        "--root-directory",
-        "/Users/behrooz/Work/recall-api",
+@pytest.mark.parametrize(
+    "test_args",
+    [
         # Missing --file-path argument
-    ]
-
-    # Temporarily replace sys.argv
-    sys.argv = test_args
-
-    with pytest.raises(SystemExit):  # argparse exits the program if arguments are missing
-        parse_arguments()
-
-
-def test_parse_arguments_invalid_args():
-    """Test that parse_arguments raises a SystemExit error for invalid arguments."""
-    test_args = ["script_name", "--invalid-arg", "some_value"]
-
-    # Temporarily replace sys.argv
-    sys.argv = test_args
+        ["script_name", "--root-directory", "/Users/behrooz/Work/recall-api"],
+        ["script_name", "--invalid-arg", "some_value"],
+    ],
+    ids=["missing-required-args", "invalid-args"],
+)
+def test_parse_arguments_rejects_bad_args(monkeypatch, test_args):
+    """Test that parse_arguments raises a SystemExit error for missing or invalid arguments."""
+    # Temporarily replace sys.argv; monkeypatch restores it on teardown
+    monkeypatch.setattr(sys, "argv", test_args)
 
-    with pytest.raises(SystemExit):  # argparse exits the program if invalid arguments are passed
+    with pytest.raises(SystemExit):  # argparse exits the program on bad arguments
         parse_arguments()
 
 
@@ -123,7 +117,7 @@ def test_find_enclosing_function_finds_parent():
 def test_set_parent_pointers_sets_parent_on_children():
     tree = ast.parse("def f(): pass")
     set_parent_pointers(tree)
-    func_def = next(n for n in ast.walk(tree) if isinstance(n, ast.FunctionDef))
+    func_def = next(n for n in ast.iter_child_nodes(tree) if isinstance(n, ast.FunctionDef))
     assert hasattr(func_def, "parent")
 
 
@@ -132,7 +126,7 @@ def test_get_method_body_reads_file(tmp_path):
     py_file = tmp_path / "m.py"
     py_file.write_text(code)
     tree = ast.parse(code)
-    func_node = next(n for n in ast.walk(tree) if isinstance(n, ast.FunctionDef))
+    func_node = next(n for n in ast.iter_child_nodes(tree) if isinstance(n, ast.FunctionDef))
     # Add line info (parse already does this)
     result = get_method_body(func_node, str(py_file))
     assert "def hello" in result
@@ -143,7 +137,7 @@ def test_print_enclosing_function_definition_from_file(tmp_path, capsys):
     py_file = tmp_path / "m.py"
     py_file.write_text(code)
     tree = ast.parse(code)
-    func_node = next(n for n in ast.walk(tree) if isinstance(n, ast.FunctionDef))
+    func_node = next(n for n in ast.iter_child_nodes(tree) if isinstance(n, ast.FunctionDef))
     print_enclosing_function_definition_from_file(func_node, str(py_file))
     out = capsys.readouterr().out
     assert "greet" in out
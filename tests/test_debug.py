@@ -1,37 +1,22 @@
 #!/usr/bin/env python3
-
-import os
-import sys
-
-# Add the current directory to the path so we can import our modules
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from pathlib import Path
 
 from source.logic.code_ast_parser import collect_method_usages
 
+REPO_ROOT = Path(__file__).resolve().parents[1]
 
-def test_method_collection():
-    # Test with the current directory and a Python file
-    root_dir = "/Users/ahmadkhorashadi/code_projects/codewise"
-    test_file = "/Users/ahmadkhorashadi/code_projects/codewise/code_evaluator.py"
-
-    print("Testing method collection...")
-    print(f"Root directory: {root_dir}")
-    print(f"Test file: {test_file}")
-
-    try:
-        result = collect_method_usages(root_dir, test_file)
-        print(f"Found {len(result)} methods with usages")
 
-        for method_pointer, call_site_infos in result.items():
-            print(f"Method: {method_pointer.method_id.method_name}")
-            print(f"  File: {method_pointer.file_path}")
-            print(f"  Usages: {len(call_site_infos)}")
+def test_method_collection():
+    # Collect usages of this repo's own AST parser helpers across the repo
+    root_dir = str(REPO_ROOT)
+    test_file = str(REPO_ROOT / "source" / "logic" / "code_ast_parser.py")
 
-    except Exception as e:
-        print(f"Error: {e}")
-        import traceback
+    result = collect_method_usages(root_dir, test_file)
 
-        traceback.print_exc()
+    assert len(result) > 0
+    for method_pointer, call_site_infos in result.items():
+        assert method_pointer.file_path == test_file
+        assert call_site_infos
 
 
 if __name__ == "__main__":
@@ -2,7 +2,6 @@
 
 import json
 import os
-import tempfile
 
 import pytest
 
@@ -10,22 +9,20 @@ from source.utils.output_storage import AnalysisOutputStorage
 
 
 @pytest.fixture
-def temp_cache_dir():
+def temp_cache_dir(tmp_path):
     """Create a temporary cache directory for testing."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield tmpdir
+    return str(tmp_path / "cache")
 
 
 @pytest.fixture
-def temp_repo_dir():
+def temp_repo_dir(tmp_path):
     """Create a temporary repository directory for testing."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        # Create sample Python files
-        with open(os.path.join(tmpdir, "module1.py"), "w") as f:
-            f.write("def func1():\n    pass\n")
-        with open(os.path.join(tmpdir, "module2.py"), "w") as f:
-            f.write("def func2():\n    pass\n")
-        yield tmpdir
+    repo_dir = tmp_path / "repo"
+    repo_dir.mkdir()
+    # Create sample Python files
+    (repo_dir / "module1.py").write_text("def func1():\n    pass\n")
+    (repo_dir / "module2.py").write_text("def func2():\n    pass\n")
+    return str(repo_dir)
 
 
 @pytest.fixture
@@ -34,9 +31,9 @@ def storage(temp_cache_dir):
     return AnalysisOutputStorage(output_dir=temp_cache_dir)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_results():
-    """Create sample analysis results."""
+    """Create sample analysis results; shared read-only, so tests must not mutate them."""
     return [
         {
             "method_name": "test_method",
@@ -164,6 +161,25 @@ class TestCacheChangeDetection:
         assert len(changes['removed']) == 1
         assert len(changes['added']) == 1
 
+    def test_detect_changes_uses_provided_cached_data(self, storage, temp_repo_dir, sample_results):
+        """Test that already-loaded cache data is used without reading the cache file again."""
+        storage.save_analysis_output(
+            root_directory=temp_repo_dir,
+            file_path=None,
+            analysis_mode="entire_project",
+            analysis_results=sample_results,
+        )
+        cached_data = storage.load_analysis_output(temp_repo_dir, None, "entire_project")
+        os.remove(storage.get_analysis_output_path(temp_repo_dir, None, "entire_project"))
+
+        with open(os.path.join(temp_repo_dir, "module3.py"), "w") as f:
+            f.write("def func3():\n    pass\n")
+
+        change_info = storage.detect_repo_changes(temp_repo_dir, None, "entire_project", cached_data=cached_data)
+
+        assert change_info is not None
+        assert len(change_info['changes']['added']) == 1
+
     def test_detect_changes_returns_none_for_nonexistent_cache(self, storage, temp_repo_dir):
         """Test that detect_changes returns None when no cache exists."""
         change_info = storage.detect_repo_changes(temp_repo_dir, None, "entire_project")
@@ -282,3 +298,22 @@ class TestCacheChangeDetection:
         for file_path, file_hash in repo_state.items():
             assert isinstance(file_hash, str)
             assert len(file_hash) == 64
+
+    def test_cache_file_contains_file_fingerprints(self, storage, temp_repo_dir, sample_results):
+        """Test that cache file records [size, mtime_ns] for files outside the racy window."""
+        module1 = os.path.join(temp_repo_dir, "module1.py")
+        stat = os.stat(module1)
+        os.utime(module1, ns=(stat.st_atime_ns, stat.st_mtime_ns - 60 * 1_000_000_000))
+
+        storage.save_analysis_output(
+            root_directory=temp_repo_dir,
+            file_path=None,
+            analysis_mode="entire_project",
+            analysis_results=sample_results,
+        )
+
+        output_path = storage.get_analysis_output_path(temp_repo_dir, None, "entire_project")
+        with open(output_path, "r") as f:
+            cached_data = json.load(f)
+
+        assert cached_data['repo_fingerprints'] == {module1: [stat.st_size, os.stat(module1).st_mtime_ns]}
@@ -2,7 +2,7 @@
 
 import json
 import os
-import tempfile
+import stat
 from pathlib import Path
 from unittest.mock import patch
 
@@ -12,10 +12,9 @@ from source.utils.output_storage import AnalysisOutputStorage
 
 
 @pytest.fixture
-def temp_cache_dir():
+def temp_cache_dir(tmp_path):
     """Create a temporary cache directory for testing."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield tmpdir
+    return str(tmp_path)
 
 
 @pytest.fixture
@@ -24,9 +23,9 @@ def storage(temp_cache_dir):
     return AnalysisOutputStorage(output_dir=temp_cache_dir)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_structured_response():
-    """Create a sample structured response."""
+    """Create a sample structured response; shared read-only, so tests must not mutate it."""
     return {
         "overall_score": 8,
         "overall_feedback": "Well-implemented method",
@@ -71,20 +70,21 @@ def sample_structured_response():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_results(sample_structured_response):
-    """Create sample analysis results with structured responses."""
+    """Create sample analysis results with structured responses; shared read-only."""
+    raw_response = json.dumps(sample_structured_response)
     return [
         {
             "method_name": "method_1",
             "file_path": "/path/to/file1.py",
-            "raw_response": json.dumps(sample_structured_response),
+            "raw_response": raw_response,
             "structured_response": sample_structured_response,
         },
         {
             "method_name": "method_2",
             "file_path": "/path/to/file2.py",
-            "raw_response": json.dumps(sample_structured_response),
+            "raw_response": raw_response,
             "structured_response": sample_structured_response,
         },
     ]
@@ -413,6 +413,50 @@ class TestGetAllCachedAnalyses:
             assert "root_directory" in info
             assert "result_count" in info
 
+    def test_cached_analysis_info_read_from_summary(self, storage, sample_results):
+        """Test that listing uses the summary sidecar instead of the full output file."""
+        output_path = storage.save_analysis_output(
+            root_directory="/test/path",
+            file_path=None,
+            analysis_mode="entire_project",
+            analysis_results=sample_results,
+        )
+        summary_path = output_path[: -len(".json")] + AnalysisOutputStorage.SUMMARY_SUFFIX
+        assert os.path.exists(summary_path)
+
+        with patch("json.load", wraps=json.load) as load_json:
+            all_cached = storage.get_all_cached_analyses()
+
+        assert list(all_cached) == [os.path.basename(output_path)]
+        assert all_cached[os.path.basename(output_path)]["result_count"] == len(sample_results)
+        assert load_json.call_count == 1
+
+    def test_cached_analysis_info_without_summary(self, storage, sample_results):
+        """Test that outputs without a summary sidecar are still listed."""
+        output_path = storage.save_analysis_output(
+            root_directory="/test/path",
+            file_path=None,
+            analysis_mode="entire_project",
+            analysis_results=sample_results,
+        )
+        os.remove(output_path[: -len(".json")] + AnalysisOutputStorage.SUMMARY_SUFFIX)
+
+        all_cached = storage.get_all_cached_analyses()
+
+        assert all_cached[os.path.basename(output_path)]["root_directory"] == "/test/path"
+
+    def test_delete_removes_summary(self, storage, sample_results):
+        """Test that deleting an output also deletes its summary sidecar."""
+        storage.save_analysis_output(
+            root_directory="/test/path",
+            file_path=None,
+            analysis_mode="entire_project",
+            analysis_results=sample_results,
+        )
+
+        assert storage.delete_analysis_output("/test/path", None, "entire_project")
+        assert os.listdir(storage.output_dir) == []
+
     def test_empty_cache_returns_empty_dict(self, storage):
         """Test that empty cache returns empty dictionary."""
         all_cached = storage.get_all_cached_analyses()
@@ -536,6 +580,46 @@ class TestOutputStorageErrorPaths:
             with pytest.raises(IOError):
                 storage.save_analysis_output("/root", "/f.py", "single_file", {"results": []})
 
+    def test_failed_save_keeps_previous_output(self, tmp_path):
+        cache_dir = tmp_path / "cache"
+        storage = AnalysisOutputStorage(output_dir=str(cache_dir))
+        root = str(tmp_path / "repo")
+        output_path = storage.save_analysis_output(root, None, "entire_project", ["old"])
+        with patch("os.replace", side_effect=OSError("rename failed")):
+            with pytest.raises(OSError):
+                storage.save_analysis_output(root, None, "entire_project", ["new"])
+        with open(output_path, "r") as f:
+            assert json.load(f)["results"] == ["old"]
+        assert not [name for name in os.listdir(cache_dir) if name.endswith(".tmp")]
+
+    def test_saved_files_get_default_permissions(self, tmp_path):
+        storage = AnalysisOutputStorage(output_dir=str(tmp_path))
+        umask = os.umask(0)
+        os.umask(umask)
+        output_path = storage.save_analysis_output("/root", None, "entire_project", ["result"])
+        summary_path = output_path[: -len(".json")] + AnalysisOutputStorage.SUMMARY_SUFFIX
+        for path in (output_path, summary_path):
+            assert stat.S_IMODE(os.stat(path).st_mode) == 0o666 & ~umask
+
+    def test_failed_save_leaves_other_writers_temp_files(self, tmp_path):
+        cache_dir = tmp_path / "cache"
+        storage = AnalysisOutputStorage(output_dir=str(cache_dir))
+        root = str(tmp_path / "repo")
+        output_path = storage.save_analysis_output(root, None, "entire_project", ["old"])
+        # Another writer's in-flight temporary file for the same output
+        other_tmp = f"{output_path}.other.tmp"
+        with open(other_tmp, "w") as f:
+            f.write("partial")
+        with patch("os.replace", side_effect=OSError("rename failed")) as mock_replace:
+            with pytest.raises(OSError):
+                storage.save_analysis_output(root, None, "entire_project", ["new"])
+        tmp_written = mock_replace.call_args.args[0]
+        assert tmp_written != other_tmp
+        assert os.path.dirname(tmp_written) == os.path.dirname(output_path)
+        assert not os.path.exists(tmp_written)
+        with open(other_tmp) as f:
+            assert f.read() == "partial"
+
     def test_delete_oserror_returns_false(self, tmp_path):
         storage = AnalysisOutputStorage(output_dir=str(tmp_path))
         output_path = os.path.join(str(tmp_path), "file.json")
@@ -2,7 +2,6 @@
 
 import json
 import os
-import tempfile
 from pathlib import Path
 
 import pytest
@@ -11,19 +10,17 @@ from source.utils.repo_state import RepositoryState
 
 
 @pytest.fixture
-def temp_repo_dir():
+def temp_repo_dir(tmp_path):
     """Create a temporary repository directory for testing."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield tmpdir
+    return str(tmp_path)
 
 
-@pytest.fixture
-def sample_repo(temp_repo_dir):
-    """Create a sample repository with Python files."""
+def _write_sample_repo(repo_dir):
+    """Create a sample repository with Python files under repo_dir."""
     # Create some Python files
-    file1_path = os.path.join(temp_repo_dir, "module1.py")
-    file2_path = os.path.join(temp_repo_dir, "module2.py")
-    subdir_path = os.path.join(temp_repo_dir, "subdir")
+    file1_path = os.path.join(repo_dir, "module1.py")
+    file2_path = os.path.join(repo_dir, "module2.py")
+    subdir_path = os.path.join(repo_dir, "subdir")
     file3_path = os.path.join(subdir_path, "module3.py")
 
     os.makedirs(subdir_path, exist_ok=True)
@@ -38,15 +35,27 @@ def sample_repo(temp_repo_dir):
     with open(file3_path, "w") as f:
         f.write("class MyClass:\n    pass\n")
 
-    return temp_repo_dir
+    return repo_dir
+
+
+@pytest.fixture
+def sample_repo(temp_repo_dir):
+    """Create a sample repository with Python files that the test may modify."""
+    return _write_sample_repo(temp_repo_dir)
+
+
+@pytest.fixture(scope="session")
+def shared_sample_repo(tmp_path_factory):
+    """The sample repository built once per session, for tests that only read it."""
+    return _write_sample_repo(str(tmp_path_factory.mktemp("shared_repo")))
 
 
 class TestComputeFileHash:
     """Tests for file hash computation."""
 
-    def test_compute_file_hash_consistent(self, sample_repo):
+    def test_compute_file_hash_consistent(self, shared_sample_repo):
         """Test that hash of same file is consistent."""
-        file_path = os.path.join(sample_repo, "module1.py")
+        file_path = os.path.join(shared_sample_repo, "module1.py")
 
         hash1 = RepositoryState._compute_file_hash(file_path)
         hash2 = RepositoryState._compute_file_hash(file_path)
@@ -67,10 +76,10 @@ class TestComputeFileHash:
 
         assert hash1 != hash2
 
-    def test_compute_file_hash_different_files(self, sample_repo):
+    def test_compute_file_hash_different_files(self, shared_sample_repo):
         """Test that different files have different hashes."""
-        file1_path = os.path.join(sample_repo, "module1.py")
-        file2_path = os.path.join(sample_repo, "module2.py")
+        file1_path = os.path.join(shared_sample_repo, "module1.py")
+        file2_path = os.path.join(shared_sample_repo, "module2.py")
 
         hash1 = RepositoryState._compute_file_hash(file1_path)
         hash2 = RepositoryState._compute_file_hash(file2_path)
@@ -86,9 +95,9 @@ class TestComputeFileHash:
 class TestComputeRepoState:
     """Tests for repository state computation."""
 
-    def test_compute_repo_state_includes_all_files(self, sample_repo):
+    def test_compute_repo_state_includes_all_files(self, shared_sample_repo):
         """Test that repo state includes all Python files."""
-        repo_state = RepositoryState.compute_repo_state(sample_repo)
+        repo_state = RepositoryState.compute_repo_state(shared_sample_repo)
 
         # Should have 3 Python files
         assert len(repo_state) == 3
@@ -133,20 +142,90 @@ class TestComputeRepoState:
         # Should still be 3 (venv excluded)
         assert len(repo_state) == 3
 
-    def test_compute_repo_state_consistent(self, sample_repo):
+    def test_compute_repo_state_skips_symlinked_dirs(self, sample_repo):
+        """Test that symlinked directories are not descended into, like os.walk."""
+        os.symlink(os.path.join(sample_repo, "subdir"), os.path.join(sample_repo, "linked"))
+
+        repo_state = RepositoryState.compute_repo_state(sample_repo)
+
+        assert len(repo_state) == 3
+        assert os.path.join(sample_repo, "subdir", "module3.py") in repo_state
+
+    def test_compute_repo_state_hashes_many_files(self, sample_repo):
+        """Test that hashing enough files to use the thread pool gives the per-file hashes."""
+        for i in range(20):
+            with open(os.path.join(sample_repo, f"extra{i}.py"), "w") as f:
+                f.write(f"VALUE = {i}\n")
+
+        repo_state = RepositoryState.compute_repo_state(sample_repo)
+
+        assert len(repo_state) == 23
+        for file_path, file_hash in repo_state.items():
+            assert file_hash == RepositoryState._compute_file_hash(file_path)
+
+    def test_compute_repo_state_consistent(self, shared_sample_repo):
         """Test that repo state is consistent for unchanged repo."""
-        state1 = RepositoryState.compute_repo_state(sample_repo)
-        state2 = RepositoryState.compute_repo_state(sample_repo)
+        state1 = RepositoryState.compute_repo_state(shared_sample_repo)
+        state2 = RepositoryState.compute_repo_state(shared_sample_repo)
 
         assert state1 == state2
 
 
+def _backdate(file_path, seconds=60):
+    """Move a file's mtime into the past so its fingerprint is outside the racy window"""
+    stat = os.stat(file_path)
+    os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns - seconds * 1_000_000_000))
+
+
+class TestComputeRepoStateWithFingerprints:
+    """Tests for fingerprint-assisted repository state computation."""
+
+    def test_matches_plain_repo_state(self, shared_sample_repo):
+        """Test that the hashes equal compute_repo_state's."""
+        repo_state, _ = RepositoryState.compute_repo_state_with_fingerprints(shared_sample_repo)
+
+        assert repo_state == RepositoryState.compute_repo_state(shared_sample_repo)
+
+    def test_recently_modified_files_have_no_fingerprint(self, sample_repo):
+        """Test that files written just now are left out of the fingerprints."""
+        _, fingerprints = RepositoryState.compute_repo_state_with_fingerprints(sample_repo)
+
+        assert fingerprints == {}
+
+    def test_unchanged_fingerprint_reuses_previous_hash(self, sample_repo):
+        """Test that a file with a matching fingerprint is not rehashed."""
+        file_path = os.path.join(sample_repo, "module1.py")
+        _backdate(file_path)
+        _, fingerprints = RepositoryState.compute_repo_state_with_fingerprints(sample_repo)
+        assert file_path in fingerprints
+
+        repo_state, _ = RepositoryState.compute_repo_state_with_fingerprints(
+            sample_repo, {file_path: "previous-hash"}, fingerprints
+        )
+
+        assert repo_state[file_path] == "previous-hash"
+
+    def test_changed_fingerprint_rehashes_file(self, sample_repo):
+        """Test that a file whose size or mtime changed is rehashed."""
+        file_path = os.path.join(sample_repo, "module1.py")
+        _backdate(file_path)
+        _, fingerprints = RepositoryState.compute_repo_state_with_fingerprints(sample_repo)
+
+        with open(file_path, "w") as f:
+            f.write("def function1():\n    return 1\n")
+        repo_state, _ = RepositoryState.compute_repo_state_with_fingerprints(
+            sample_repo, {file_path: "previous-hash"}, fingerprints
+        )
+
+        assert repo_state[file_path] == RepositoryState._compute_file_hash(file_path)
+
+
 class TestComputeRepoHash:
     """Tests for repository-level hash computation."""
 
-    def test_compute_repo_hash_consistent(self, sample_repo):
+    def test_compute_repo_hash_consistent(self, shared_sample_repo):
         """Test that repo hash is consistent for same state."""
-        repo_state = RepositoryState.compute_repo_state(sample_repo)
+        repo_state = RepositoryState.compute_repo_state(shared_sample_repo)
 
         hash1 = RepositoryState.compute_repo_hash(repo_state)
         hash2 = RepositoryState.compute_repo_hash(repo_state)
@@ -168,6 +247,13 @@ class TestComputeRepoHash:
 
         assert hash1 != hash2
 
+    def test_compute_repo_hash_distinguishes_entry_boundaries(self):
+        """Test that states whose path/hash pairs concatenate to the same text hash differently."""
+        hash1 = RepositoryState.compute_repo_hash({"a.py:x": "y"})
+        hash2 = RepositoryState.compute_repo_hash({"a.py": "x:y"})
+
+        assert hash1 != hash2
+
     def test_compute_repo_hash_empty_state(self):
         """Test repo hash for empty repository."""
         hash_val = RepositoryState.compute_repo_hash({})
@@ -178,10 +264,10 @@ class TestComputeRepoHash:
 class TestDetectChanges:
     """Tests for change detection between states."""
 
-    def test_detect_no_changes(self, sample_repo):
+    def test_detect_no_changes(self, shared_sample_repo):
         """Test that no changes are detected for identical states."""
-        state1 = RepositoryState.compute_repo_state(sample_repo)
-        state2 = RepositoryState.compute_repo_state(sample_repo)
+        state1 = RepositoryState.compute_repo_state(shared_sample_repo)
+        state2 = RepositoryState.compute_repo_state(shared_sample_repo)
 
         changes = RepositoryState.detect_changes(state1, state2)
 
@@ -264,14 +350,23 @@ class TestDetectChanges:
         assert len(changes['removed']) == 1
         assert len(changes['modified']) == 1
 
+    def test_detect_changes_lists_are_sorted(self):
+        """Test that each change list is reported in sorted order."""
+        old_state = {"b.py": "1", "a.py": "1", "d.py": "1", "c.py": "1"}
+        new_state = {"d.py": "2", "c.py": "2", "f.py": "1", "e.py": "1"}
+
+        changes = RepositoryState.detect_changes(old_state, new_state)
+
+        assert changes == {"added": ["e.py", "f.py"], "removed": ["a.py", "b.py"], "modified": ["c.py", "d.py"]}
+
 
 class TestHasChanges:
     """Tests for the has_changes convenience method."""
 
-    def test_has_changes_returns_false_for_identical_states(self, sample_repo):
+    def test_has_changes_returns_false_for_identical_states(self, shared_sample_repo):
         """Test that has_changes returns False for identical states."""
-        state1 = RepositoryState.compute_repo_state(sample_repo)
-        state2 = RepositoryState.compute_repo_state(sample_repo)
+        state1 = RepositoryState.compute_repo_state(shared_sample_repo)
+        state2 = RepositoryState.compute_repo_state(shared_sample_repo)
 
         has_changes = RepositoryState.has_changes(state1, state2)
 